@@ -1,3 +1,4 @@
+import types
 import typing
 
 from .definitions import ActiveAddressesResponse
@@ -42,7 +43,8 @@ from .definitions import WhitelistedAddress
 
 AnyDefinition = typing.TypeVar("AnyDefinition", bound=Definition)
 
-name_to_class: typing.Dict[str, typing.Callable[[], typing.Type[AnyDefinition]]] = {
+# read-only, the unmarshal handlers are compiled once per response type from it
+name_to_class: typing.Mapping[str, typing.Callable[[], typing.Type[AnyDefinition]]] = types.MappingProxyType({
     "TokenPortfolioResponse": TokenPortfolioResponse,
     "BalanceMove": BalanceMove,
     "LPMoveResponse": LPMoveResponse,
@@ -81,4 +83,4 @@ name_to_class: typing.Dict[str, typing.Callable[[], typing.Type[AnyDefinition]]]
     "Balance": Balance,
     "BasicPool": BasicPool,
     "MarketDepth": MarketDepth
-}
+})
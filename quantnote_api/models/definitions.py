@@ -1,74 +1,138 @@
 import keyword
-from typing import List, Dict, Any
+from datetime import datetime
+from types import MappingProxyType
+from typing import List, Dict, Any, Tuple, Type, Mapping
 
 from dateutil.parser import isoparse
 
-from quantnote_api import models
+
+def _isoparse(date: str) -> datetime:
+    """
+    Parses the ISO formatted date of the API with the C implemented fromisoformat, the generic (and much slower)
+    dateutil parser is used only for the formats it does not accept.
+    """
+    try:
+        return datetime.fromisoformat(date.replace("Z", "+00:00"))
+    except ValueError:
+        return isoparse(date)
+
+
+# unknown keys that are python keywords are stored with a trailing underscore
+_KEYWORDS = frozenset(keyword.kwlist)
+
+# tags of the parse plan: how the value of an attribute is unmarshalled
+_PRIMITIVE, _MODEL, _MODEL_LIST, _RAW = range(4)
 
 
 class Definition:
-    _api_name_to_python: Dict[str, str]
-    _attribute_is_primitive: Dict[str, bool]
-    _attributes_to_types: Dict[str, Any]
+    _api_name_to_python: Mapping[str, str]
+    _attribute_is_primitive: Mapping[str, bool]
+    _attributes_to_types: Mapping[str, Any]
+    # API name -> (attribute name, tag, type), built once per class from the tables above
+    _parse_plan: Dict[str, Tuple[str, int, Any]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # the tables are read only here, they are frozen so the parse plan cannot get out of sync with them
+        cls._api_name_to_python = MappingProxyType(cls._api_name_to_python)
+        cls._attribute_is_primitive = MappingProxyType(cls._attribute_is_primitive)
+        cls._attributes_to_types = MappingProxyType(cls._attributes_to_types)
+        cls._parse_plan = {key: (attribute_name, *cls._attribute_parser(attribute_name))
+                           for key, attribute_name in cls._api_name_to_python.items()}
+        if all(tag == _PRIMITIVE for _, tag, _ in cls._parse_plan.values()):
+            cls._unmarshal_json_object = cls._unmarshal_primitive_object
+
+    @classmethod
+    def _attribute_parser(cls, attribute_name: str) -> Tuple[int, Any]:
+        model = cls._attributes_to_types.get(attribute_name)
+        if cls._attribute_is_primitive[attribute_name]:
+            return _PRIMITIVE, model
+        if model is None:
+            return _RAW, None
+        if getattr(model, "__origin__", None) in (list, List):
+            return _MODEL_LIST, model.__args__[0]
+        return _MODEL, model
 
     def __repr__(self) -> str:
-        attributes = ""
+        parts = [f"{self.__class__.__name__}(\n"]
         for key, value in vars(self).items():
-            value = str(value).replace("\n", "\n\t")
-            attributes += f"\t{key} = {value},\n"
-        return f"{self.__class__.__name__}(\n{attributes})"
+            # numbers and dates never span multiple lines, unlike texts and nested models
+            if not isinstance(value, (int, float, datetime)):
+                value = str(value).replace("\n", "\n\t")
+            parts.append(f"\t{key} = {value},\n")
+        parts.append(")")
+        return "".join(parts)
 
     def to_dict(self):
         return self.__dict__
 
     def unmarshal_json(self, input_json):
+        # objects are by far the most frequent input, so they are checked first
+        if isinstance(input_json, dict):
+            self._unmarshal_json_object(input_json)
+            return self
         if isinstance(input_json, list):
-            list_attribute_name = list(self._api_name_to_python.values())[0]
-            if list_attribute_name in self._attributes_to_types:
-                list_type = self._attributes_to_types[list_attribute_name]
-                known_type = list_type.split("[")[1][:-1]
-                list_items = self._unmarshal_json_list(input_json, known_type)
+            list_attribute_name, tag, model = next(iter(self._parse_plan.values()))
+            if tag == _MODEL_LIST:
+                list_items = self._unmarshal_json_list(input_json, model)
             else:
                 list_items = input_json
-            self.__setattr__(list_attribute_name, list_items)
-            return self
-        if isinstance(input_json, dict):
-            self._unmarshal_json_object(input_json)
+            self.__dict__[list_attribute_name] = list_items
             return self
-        if isinstance(input_json, float) or isinstance(input_json, int):
+        if isinstance(input_json, (float, int)):
             return input_json
 
     @staticmethod
-    def _unmarshal_json_list(input_json, known_type):
-        items = []
-        for item in input_json:
-            new_item = models.name_to_class[known_type]()
-            items.append(new_item._unmarshal_json_object(item))
-
-        return items
+    def _unmarshal_json_list(input_json, definition: Type["Definition"]):
+        # __init__ only declares the attributes, so the instances are created by __new__ alone
+        unmarshal_object = definition._unmarshal_json_object
+        new = definition.__new__
+        return [unmarshal_object(new(definition), item) for item in input_json]
 
     def _unmarshal_json_object(self, input_json):
+        # the parse plan of the class resolves each key with one lookup, the values are stored into the instance dict
+        parse_plan = self._parse_plan
+        attributes = self.__dict__
         for key, value in input_json.items():
-            if key in self._api_name_to_python:
-                attribute_name = self._api_name_to_python[key]
-                if not self._attribute_is_primitive[attribute_name]:
-                    if attribute_name in self._attributes_to_types:
-                        model = self._attributes_to_types[attribute_name]
-                        if "List" in str(model):
-                            response_type = f"List[{model.__args__[0].__name__}]"
-                            value = models.unmarshal.unmarshal_json(response_type, input_json[key])
-                        else:
-                            value = model().unmarshal_json(input_json[key])
-                else:
-                    value = self._attributes_to_types[attribute_name](value)
-            else:
-                attribute_name = key + ('_' if keyword.iskeyword(key) else '')
+            plan = parse_plan.get(key)
+            if plan is None:
+                attributes[key + '_' if key in _KEYWORDS else key] = value
+                continue
+            attribute_name, tag, model = plan
+            if tag == _PRIMITIVE:
+                # orjson already decodes most values to their types, only the rest is cast
+                if type(value) is not model:
+                    value = model(value)
+            elif tag == _MODEL_LIST:
+                value = self._unmarshal_json_list(value, model)
+            elif tag == _MODEL:
+                value = model().unmarshal_json(value)
+            attributes[attribute_name] = value
+        return self
 
-            self.__setattr__(attribute_name, value)
+    def _unmarshal_primitive_object(self, input_json):
+        # specialization of _unmarshal_json_object for the classes with primitive attributes only
+        parse_plan = self._parse_plan
+        attributes = self.__dict__
+        for key, value in input_json.items():
+            plan = parse_plan.get(key)
+            if plan is None:
+                attributes[key + '_' if key in _KEYWORDS else key] = value
+                continue
+            attribute_name, _, model = plan
+            attributes[attribute_name] = value if type(value) is model else model(value)
         return self
 
 
 class PoolBalance(Definition):
+    balance: float
+    pending_reward: float
+    pending_reward_price: float
+    price: float
+    reward_token: str
+    token: str
+    token_address: str
+
     _api_name_to_python = {
         "balance": "balance",
         "pending_reward": "pending_reward",
@@ -99,17 +163,11 @@ class PoolBalance(Definition):
         "token_address": str,
     }
 
-    def __init__(self):
-        self.balance: float
-        self.pending_reward: float
-        self.pending_reward_price: float
-        self.price: float
-        self.reward_token: str
-        self.token: str
-        self.token_address: str
-
 
 class WhitelistedAddress(Definition):
+    address: str
+    id: int
+
     _api_name_to_python = {
         "address": "address",
         "id": "id",
@@ -125,12 +183,13 @@ class WhitelistedAddress(Definition):
         "id": int,
     }
 
-    def __init__(self):
-        self.address: str
-        self.id: int
-
 
 class FarmPortfolio(Definition):
+    farm_icon: str
+    farm_name: str
+    farm_true_name: str
+    pools_balance: List[PoolBalance]
+
     _api_name_to_python = {
         "farm_icon": "farm_icon",
         "farm_name": "farm_name",
@@ -152,14 +211,18 @@ class FarmPortfolio(Definition):
         "pools_balance": List[PoolBalance],
     }
 
-    def __init__(self):
-        self.farm_icon: str
-        self.farm_name: str
-        self.farm_true_name: str
-        self.pools_balance: List[PoolBalance]
-
 
 class TokenResponse(Definition):
+    active: bool
+    chain: str
+    circulating_supply: float
+    contract: str
+    decimals: float
+    id: int
+    name: str
+    symbol: str
+    total_supply: float
+
     _api_name_to_python = {
         "active": "active",
         "chain": "chain",
@@ -196,101 +259,15 @@ class TokenResponse(Definition):
         "total_supply": float,
     }
 
-    def __init__(self):
-        self.active: bool
-        self.chain: str
-        self.circulating_supply: float
-        self.contract: str
-        self.decimals: float
-        self.id: int
-        self.name: str
-        self.symbol: str
-        self.total_supply: float
-
 
 class BasicPoolInfo(Definition):
-    _api_name_to_python = {
-        "apr": "apr",
-        "apy": "apy",
-        "reward_token": "reward_token",
-        "token": "token",
-        "token_address": "token_address",
-        "tvl": "tvl",
-    }
-
-    _attribute_is_primitive = {
-        "apr": True,
-        "apy": True,
-        "reward_token": True,
-        "token": True,
-        "token_address": True,
-        "tvl": True,
-    }
-
-    _attributes_to_types = {
-        "apr": float,
-        "apy": float,
-        "reward_token": str,
-        "token": str,
-        "token_address": str,
-        "tvl": float,
-    }
-
-    def __init__(self):
-        self.apr: float
-        self.apy: float
-        self.reward_token: str
-        self.token: str
-        self.token_address: str
-        self.tvl: float
-
-
-class BasicOptimizerPoolInfo(Definition):
-    _api_name_to_python = {
-        "apy": "apy",
-        "farm_apr": "farm_apr",
-        "from_platform": "from_platform",
-        "reward_token": "reward_token",
-        "rewards_apr": "rewards_apr",
-        "token": "token",
-        "token_address": "token_address",
-        "tvl": "tvl",
-    }
-
-    _attribute_is_primitive = {
-        "apy": True,
-        "farm_apr": True,
-        "from_platform": True,
-        "reward_token": True,
-        "rewards_apr": True,
-        "token": True,
-        "token_address": True,
-        "tvl": True,
-    }
-
-    _attributes_to_types = {
-        "apy": float,
-        "farm_apr": float,
-        "from_platform": str,
-        "reward_token": str,
-        "rewards_apr": float,
-        "token": str,
-        "token_address": str,
-        "tvl": float,
-    }
-
-    def __init__(self):
-        self.apy: float
-        self.farm_apr: float
-        self.from_platform: str
-        self.reward_token: str
-        self.rewards_apr: float
-        self.token: str
-        self.token_address: str
-        self.tvl: float
+    apr: float
+    apy: float
+    reward_token: str
+    token: str
+    token_address: str
+    tvl: float
 
-
-class BasicPoolInfo(Definition):
     _api_name_to_python = {
         "apr": "apr",
         "apy": "apy",
@@ -318,16 +295,17 @@ class BasicPoolInfo(Definition):
         "tvl": float,
     }
 
-    def __init__(self):
-        self.apr: float
-        self.apy: float
-        self.reward_token: str
-        self.token: str
-        self.token_address: str
-        self.tvl: float
-
 
 class BasicOptimizerPoolInfo(Definition):
+    apy: float
+    farm_apr: float
+    from_platform: str
+    reward_token: str
+    rewards_apr: float
+    token: str
+    token_address: str
+    tvl: float
+
     _api_name_to_python = {
         "apy": "apy",
         "farm_apr": "farm_apr",
@@ -361,18 +339,11 @@ class BasicOptimizerPoolInfo(Definition):
         "tvl": float,
     }
 
-    def __init__(self):
-        self.apy: float
-        self.farm_apr: float
-        self.from_platform: str
-        self.reward_token: str
-        self.rewards_apr: float
-        self.token: str
-        self.token_address: str
-        self.tvl: float
-
 
 class Domain(Definition):
+    authority: int
+    url: str
+
     _api_name_to_python = {
         "authority": "authority",
         "url": "url",
@@ -388,12 +359,11 @@ class Domain(Definition):
         "url": str,
     }
 
-    def __init__(self):
-        self.authority: int
-        self.url: str
-
 
 class Tag(Definition):
+    id: int
+    tag: str
+
     _api_name_to_python = {
         "id": "id",
         "tag": "tag",
@@ -409,12 +379,12 @@ class Tag(Definition):
         "tag": str,
     }
 
-    def __init__(self):
-        self.id: int
-        self.tag: str
-
 
 class BasicPool(Definition):
+    reward_token: str
+    token: str
+    token_address: str
+
     _api_name_to_python = {
         "reward_token": "reward_token",
         "token": "token",
@@ -433,13 +403,13 @@ class BasicPool(Definition):
         "token_address": str,
     }
 
-    def __init__(self):
-        self.reward_token: str
-        self.token: str
-        self.token_address: str
-
 
 class BasicOptimizerPool(Definition):
+    from_platform: str
+    reward_token: str
+    token: str
+    token_address: str
+
     _api_name_to_python = {
         "from_platform": "from_platform",
         "reward_token": "reward_token",
@@ -461,14 +431,13 @@ class BasicOptimizerPool(Definition):
         "token_address": str,
     }
 
-    def __init__(self):
-        self.from_platform: str
-        self.reward_token: str
-        self.token: str
-        self.token_address: str
-
 
 class Balance(Definition):
+    createdAt: str
+    portfolio: str
+    wallet: WhitelistedAddress
+    walletID: int
+
     _api_name_to_python = {
         "createdAt": "createdAt",
         "portfolio": "portfolio",
@@ -490,14 +459,13 @@ class Balance(Definition):
         "walletID": int,
     }
 
-    def __init__(self):
-        self.createdAt: str
-        self.portfolio: str
-        self.wallet: WhitelistedAddress
-        self.walletID: int
-
 
 class BalanceMove(Definition):
+    move: float
+    timestamp: str
+    token_id: int
+    wallet_id: int
+
     _api_name_to_python = {
         "move": "move",
         "timestamp": "timestamp",
@@ -519,14 +487,13 @@ class BalanceMove(Definition):
         "wallet_id": int,
     }
 
-    def __init__(self):
-        self.move: float
-        self.timestamp: str
-        self.token_id: int
-        self.wallet_id: int
-
 
 class BalanceMoveLP(Definition):
+    move: float
+    timestamp: str
+    token_id: int
+    wallet_id: int
+
     _api_name_to_python = {
         "move": "move",
         "timestamp": "timestamp",
@@ -548,14 +515,14 @@ class BalanceMoveLP(Definition):
         "wallet_id": int,
     }
 
-    def __init__(self):
-        self.move: float
-        self.timestamp: str
-        self.token_id: int
-        self.wallet_id: int
-
 
 class Liquidity(Definition):
+    platform_id: int
+    reserve_0: float
+    reserve_1: float
+    timestamp: str
+    token_id: int
+
     _api_name_to_python = {
         "platform_id": "platform_id",
         "reserve_0": "reserve_0",
@@ -580,15 +547,15 @@ class Liquidity(Definition):
         "token_id": int,
     }
 
-    def __init__(self):
-        self.platform_id: int
-        self.reserve_0: float
-        self.reserve_1: float
-        self.timestamp: str
-        self.token_id: int
-
 
 class PriceTick(Definition):
+    circulating_supply: float
+    platform_id: int
+    price_peg: float
+    price_stable: float
+    timestamp: str
+    token_id: int
+
     _api_name_to_python = {
         "circulating_supply": "circulating_supply",
         "platform_id": "platform_id",
@@ -616,16 +583,13 @@ class PriceTick(Definition):
         "token_id": int,
     }
 
-    def __init__(self):
-        self.circulating_supply: float
-        self.platform_id: int
-        self.price_peg: float
-        self.price_stable: float
-        self.timestamp: str
-        self.token_id: int
-
 
 class VolumeTick(Definition):
+    platform_id: int
+    timestamp: str
+    token_id: int
+    volume: float
+
     _api_name_to_python = {
         "platform_id": "platform_id",
         "timestamp": "timestamp",
@@ -647,14 +611,11 @@ class VolumeTick(Definition):
         "volume": float,
     }
 
-    def __init__(self):
-        self.platform_id: int
-        self.timestamp: str
-        self.token_id: int
-        self.volume: float
-
 
 class ActiveAddressesResponse(Definition):
+    count: int
+    time: datetime
+
     _api_name_to_python = {
         "count": "count",
         "time": "time",
@@ -667,15 +628,15 @@ class ActiveAddressesResponse(Definition):
 
     _attributes_to_types = {
         "count": int,
-        "time": isoparse,
+        "time": _isoparse,
     }
 
-    def __init__(self):
-        self.count: int
-        self.time: isoparse
-
 
 class FarmResponse(Definition):
+    name: str
+    true_name: str
+    tvl: float
+
     _api_name_to_python = {
         "name": "name",
         "true_name": "true_name",
@@ -694,13 +655,13 @@ class FarmResponse(Definition):
         "tvl": float,
     }
 
-    def __init__(self):
-        self.name: str
-        self.true_name: str
-        self.tvl: float
-
 
 class FarmsPortfolioResponse(Definition):
+    lp_pools: List[FarmPortfolio]
+    optimizer_lp_pools: List[FarmPortfolio]
+    optimizer_single_asset_pools: List[FarmPortfolio]
+    single_asset_pools: List[FarmPortfolio]
+
     _api_name_to_python = {
         "lp_pools": "lp_pools",
         "optimizer_lp_pools": "optimizer_lp_pools",
@@ -722,14 +683,12 @@ class FarmsPortfolioResponse(Definition):
         "single_asset_pools": List[FarmPortfolio],
     }
 
-    def __init__(self):
-        self.lp_pools: List[FarmPortfolio]
-        self.optimizer_lp_pools: List[FarmPortfolio]
-        self.optimizer_single_asset_pools: List[FarmPortfolio]
-        self.single_asset_pools: List[FarmPortfolio]
-
 
 class LPLiquidityResponse(Definition):
+    liquidity_0: float
+    liquidity_1: float
+    time: datetime
+
     _api_name_to_python = {
         "liquidity_0": "liquidity_0",
         "liquidity_1": "liquidity_1",
@@ -745,16 +704,17 @@ class LPLiquidityResponse(Definition):
     _attributes_to_types = {
         "liquidity_0": float,
         "liquidity_1": float,
-        "time": isoparse,
+        "time": _isoparse,
     }
 
-    def __init__(self):
-        self.liquidity_0: float
-        self.liquidity_1: float
-        self.time: isoparse
-
 
 class LPMoveResponse(Definition):
+    amount_0: float
+    amount_1: float
+    time: datetime
+    token_contract: str
+    token_symbol: str
+
     _api_name_to_python = {
         "amount_0": "amount_0",
         "amount_1": "amount_1",
@@ -774,20 +734,23 @@ class LPMoveResponse(Definition):
     _attributes_to_types = {
         "amount_0": float,
         "amount_1": float,
-        "time": isoparse,
+        "time": _isoparse,
         "token_contract": str,
         "token_symbol": str,
     }
 
-    def __init__(self):
-        self.amount_0: float
-        self.amount_1: float
-        self.time: isoparse
-        self.token_contract: str
-        self.token_symbol: str
-
 
 class LPTokenResponse(Definition):
+    chain: str
+    contract: str
+    decimals: float
+    id: int
+    name: str
+    symbol: str
+    token_0: TokenResponse
+    token_1: TokenResponse
+    total_supply: float
+
     _api_name_to_python = {
         "chain": "chain",
         "contract": "contract",
@@ -824,19 +787,13 @@ class LPTokenResponse(Definition):
         "total_supply": float,
     }
 
-    def __init__(self):
-        self.chain: str
-        self.contract: str
-        self.decimals: float
-        self.id: int
-        self.name: str
-        self.symbol: str
-        self.token_0: TokenResponse
-        self.token_1: TokenResponse
-        self.total_supply: float
-
 
 class PoolsInfoResponse(Definition):
+    lp_pools: List[BasicPoolInfo]
+    optimizer_lp_pools: List[BasicOptimizerPoolInfo]
+    optimizer_single_asset_pools: List[BasicOptimizerPoolInfo]
+    single_asset_pools: List[BasicPoolInfo]
+
     _api_name_to_python = {
         "lp_pools": "lp_pools",
         "optimizer_lp_pools": "optimizer_lp_pools",
@@ -858,14 +815,13 @@ class PoolsInfoResponse(Definition):
         "single_asset_pools": List[BasicPoolInfo],
     }
 
-    def __init__(self):
-        self.lp_pools: List[BasicPoolInfo]
-        self.optimizer_lp_pools: List[BasicOptimizerPoolInfo]
-        self.optimizer_single_asset_pools: List[BasicOptimizerPoolInfo]
-        self.single_asset_pools: List[BasicPoolInfo]
-
 
 class PoolsResponse(Definition):
+    lp_pools: List[BasicPool]
+    optimizer_lp_pools: List[BasicOptimizerPool]
+    optimizer_single_asset_pools: List[BasicOptimizerPool]
+    single_asset_pools: List[BasicPool]
+
     _api_name_to_python = {
         "lp_pools": "lp_pools",
         "optimizer_lp_pools": "optimizer_lp_pools",
@@ -887,14 +843,11 @@ class PoolsResponse(Definition):
         "single_asset_pools": List[BasicPool],
     }
 
-    def __init__(self):
-        self.lp_pools: List[BasicPool]
-        self.optimizer_lp_pools: List[BasicOptimizerPool]
-        self.optimizer_single_asset_pools: List[BasicOptimizerPool]
-        self.single_asset_pools: List[BasicPool]
-
 
 class PortfolioResponse(Definition):
+    portfolio: str
+    time: datetime
+
     _api_name_to_python = {
         "portfolio": "portfolio",
         "time": "time",
@@ -907,15 +860,18 @@ class PortfolioResponse(Definition):
 
     _attributes_to_types = {
         "portfolio": str,
-        "time": isoparse,
+        "time": _isoparse,
     }
 
-    def __init__(self):
-        self.portfolio: str
-        self.time: isoparse
-
 
 class TokenPortfolioResponse(Definition):
+    balance: float
+    token_address: str
+    token_icon: str
+    token_name: str
+    token_symbol: str
+    usd_value: float
+
     _api_name_to_python = {
         "balance": "balance",
         "token_address": "token_address",
@@ -943,16 +899,14 @@ class TokenPortfolioResponse(Definition):
         "usd_value": float,
     }
 
-    def __init__(self):
-        self.balance: float
-        self.token_address: str
-        self.token_icon: str
-        self.token_name: str
-        self.token_symbol: str
-        self.usd_value: float
-
 
 class TokenPriceResponse(Definition):
+    close: float
+    high: float
+    low: float
+    open: float
+    time: datetime
+
     _api_name_to_python = {
         "close": "close",
         "high": "high",
@@ -974,18 +928,28 @@ class TokenPriceResponse(Definition):
         "high": float,
         "low": float,
         "open": float,
-        "time": isoparse,
+        "time": _isoparse,
     }
 
-    def __init__(self):
-        self.close: float
-        self.high: float
-        self.low: float
-        self.open: float
-        self.time: isoparse
-
 
 class TokenResponseExtended(Definition):
+    active: bool
+    chain: str
+    circulating_supply: float
+    contract: str
+    decimals: float
+    id: int
+    liquidity_usd: float
+    market_cap: float
+    name: str
+    price_change_24_h: float
+    price_change_7_d: float
+    price_peg: float
+    price_usd: float
+    symbol: str
+    total_supply: float
+    volume_24_h: float
+
     _api_name_to_python = {
         "active": "active",
         "chain": "chain",
@@ -1043,26 +1007,11 @@ class TokenResponseExtended(Definition):
         "volume_24_h": float,
     }
 
-    def __init__(self):
-        self.active: bool
-        self.chain: str
-        self.circulating_supply: float
-        self.contract: str
-        self.decimals: float
-        self.id: int
-        self.liquidity_usd: float
-        self.market_cap: float
-        self.name: str
-        self.price_change_24_h: float
-        self.price_change_7_d: float
-        self.price_peg: float
-        self.price_usd: float
-        self.symbol: str
-        self.total_supply: float
-        self.volume_24_h: float
-
 
 class TradedVolumeResponse(Definition):
+    time: datetime
+    volume: float
+
     _api_name_to_python = {
         "time": "time",
         "volume": "volume",
@@ -1074,16 +1023,20 @@ class TradedVolumeResponse(Definition):
     }
 
     _attributes_to_types = {
-        "time": isoparse,
+        "time": _isoparse,
         "volume": float,
     }
 
-    def __init__(self):
-        self.time: isoparse
-        self.volume: float
-
 
 class TransactionResponse(Definition):
+    block: int
+    from_address: str
+    time: datetime
+    to_address: str
+    tx_fee: float
+    tx_hash: str
+    value: float
+
     _api_name_to_python = {
         "block": "block",
         "from_address": "from_address",
@@ -1107,24 +1060,19 @@ class TransactionResponse(Definition):
     _attributes_to_types = {
         "block": int,
         "from_address": str,
-        "time": isoparse,
+        "time": _isoparse,
         "to_address": str,
         "tx_fee": float,
         "tx_hash": str,
         "value": float,
     }
 
-    def __init__(self):
-        self.block: int
-        self.from_address: str
-        self.time: isoparse
-        self.to_address: str
-        self.tx_fee: float
-        self.tx_hash: str
-        self.value: float
-
 
 class WalletMoveResponse(Definition):
+    amount: float
+    time: datetime
+    token: str
+
     _api_name_to_python = {
         "amount": "amount",
         "time": "time",
@@ -1139,17 +1087,16 @@ class WalletMoveResponse(Definition):
 
     _attributes_to_types = {
         "amount": float,
-        "time": isoparse,
+        "time": _isoparse,
         "token": str,
     }
 
-    def __init__(self):
-        self.amount: float
-        self.time: isoparse
-        self.token: str
-
 
 class MarketDepth(Definition):
+    time: datetime
+    current_price: float
+    depth: str
+
     _api_name_to_python = {
         "time": "time",
         "current_price": "current_price",
@@ -1163,18 +1110,18 @@ class MarketDepth(Definition):
     }
 
     _attributes_to_types = {
-        "time": isoparse,
+        "time": _isoparse,
         "current_price": float,
         "depth": str,
     }
 
-    def __init__(self):
-        self.time: isoparse
-        self.current_price: float
-        self.depth: str
-
 
 class AvailableAsset(Definition):
+    chain: int
+    contract: str
+    is_default: bool
+    symbol: str
+
     _api_name_to_python = {
         "chain": "chain",
         "contract": "contract",
@@ -1196,14 +1143,12 @@ class AvailableAsset(Definition):
         "symbol": str,
     }
 
-    def __init__(self):
-        self.chain: int
-        self.contract: str
-        self.is_default: bool
-        self.symbol: str
-
 
 class DiscordPublicMessage(Definition):
+    content: str
+    created_at: datetime
+    id: int
+
     _api_name_to_python = {
         "content": "content",
         "created_at": "created_at",
@@ -1218,17 +1163,18 @@ class DiscordPublicMessage(Definition):
 
     _attributes_to_types = {
         "content": str,
-        "created_at": isoparse,
+        "created_at": _isoparse,
         "id": int,
     }
 
-    def __init__(self):
-        self.content: str
-        self.created_at: isoparse
-        self.id: int
-
 
 class PublicReadable(Definition):
+    created_at: datetime
+    domain: Domain
+    source: str
+    text: str
+    title: str
+
     _api_name_to_python = {
         "created_at": "created_at",
         "domain": "domain",
@@ -1246,22 +1192,26 @@ class PublicReadable(Definition):
     }
 
     _attributes_to_types = {
-        "created_at": isoparse,
+        "created_at": _isoparse,
         "domain": Domain,
         "source": str,
         "text": str,
         "title": str,
     }
 
-    def __init__(self):
-        self.created_at: isoparse
-        self.domain: Domain
-        self.source: str
-        self.text: str
-        self.title: str
-
 
 class Readable(Definition):
+    comment_count: int
+    created_at: datetime
+    domain: Domain
+    emotion: float
+    id: int
+    published_at: str
+    source: str
+    tags: List[Tag]
+    title: str
+    view_count: int
+
     _api_name_to_python = {
         "comment_count": "comment_count",
         "created_at": "created_at",
@@ -1290,7 +1240,7 @@ class Readable(Definition):
 
     _attributes_to_types = {
         "comment_count": int,
-        "created_at": isoparse,
+        "created_at": _isoparse,
         "domain": Domain,
         "emotion": float,
         "id": int,
@@ -1301,20 +1251,13 @@ class Readable(Definition):
         "view_count": int,
     }
 
-    def __init__(self):
-        self.comment_count: int
-        self.created_at: isoparse
-        self.domain: Domain
-        self.emotion: float
-        self.id: int
-        self.published_at: str
-        self.source: str
-        self.tags: List[Tag]
-        self.title: str
-        self.view_count: int
-
 
 class TelegramPublicMessage(Definition):
+    content: str
+    created_at: datetime
+    message_id: int
+    sent_at: datetime
+
     _api_name_to_python = {
         "content": "content",
         "created_at": "created_at",
@@ -1331,19 +1274,17 @@ class TelegramPublicMessage(Definition):
 
     _attributes_to_types = {
         "content": str,
-        "created_at": isoparse,
+        "created_at": _isoparse,
         "message_id": int,
-        "sent_at": isoparse,
+        "sent_at": _isoparse,
     }
 
-    def __init__(self):
-        self.content: str
-        self.created_at: isoparse
-        self.message_id: int
-        self.sent_at: isoparse
-
 
 class TweetPublic(Definition):
+    content: str
+    created_at: datetime
+    tweet_id: int
+
     _api_name_to_python = {
         "content": "content",
         "created_at": "created_at",
@@ -1358,11 +1299,6 @@ class TweetPublic(Definition):
 
     _attributes_to_types = {
         "content": str,
-        "created_at": isoparse,
+        "created_at": _isoparse,
         "tweet_id": int,
     }
-
-    def __init__(self):
-        self.content: str
-        self.created_at: isoparse
-        self.tweet_id: int
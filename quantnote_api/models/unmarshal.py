@@ -1,24 +1,44 @@
-from typing import Type
+import functools
+from types import MappingProxyType
+from typing import Type, Callable, Any
 
 from quantnote_api import models
 
-name_to_class = {
+name_to_class = MappingProxyType({
     "int": int,
     "float": float,
     "str": str,
-}
+})
 
 
 def unmarshal_json(response_type, resp_json) -> Type[models.AnyDefinition]:
-    if response_type in name_to_class.keys():
-        return name_to_class[response_type](resp_json)
-    if isinstance(resp_json, list):
-        if "List[" in response_type:
-            response_type = response_type.split("[")[1][:-1]
-        return models.Definition._unmarshal_json_list(resp_json, response_type)
+    """
+    Unmarshals the json by the response type string; it is resolved only once, a repeated type costs one cache hit of
+    _parser.
+    """
+    return _parser(response_type)(resp_json)
+
+
+@functools.lru_cache(maxsize=None)
+def _parser(response_type: str) -> Callable[[Any], Any]:
+    """
+    Returns the function unmarshalling the json of the response type, the type string is parsed once per type.
+    """
+    if response_type in name_to_class:
+        return name_to_class[response_type]
     if "Dict[" in response_type:
-        known_type = response_type.split(", ")[1][:-1]
-        return {k: unmarshal_json(known_type, v) for k, v in resp_json.items()}
-    obj = models.name_to_class[response_type]()
-    obj.unmarshal_json(resp_json)
-    return obj
+        parse_value = _parser(response_type.split(", ")[1][:-1])
+        return lambda resp_json: {k: parse_value(v) for k, v in resp_json.items()}
+    if "List[" in response_type:
+        response_type = response_type.split("[")[1][:-1]
+
+    definition = models.name_to_class[response_type]
+
+    def unmarshal_definition(resp_json):
+        if isinstance(resp_json, list):
+            return models.Definition._unmarshal_json_list(resp_json, definition)
+        obj = definition()
+        obj.unmarshal_json(resp_json)
+        return obj
+
+    return unmarshal_definition
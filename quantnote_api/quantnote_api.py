@@ -2,26 +2,32 @@
 Rest API client library for Helixir data source.
 """
 
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
 import sys
+import threading
 import warnings
-from typing import List, Dict, Union, Tuple, Type
+from collections import Counter, OrderedDict
+from typing import List, Dict, Union, Tuple, Type, Collection, Hashable, Iterator, Callable
 
 if sys.version_info >= (3, 8):  # TODO: is it necessary?
     from typing import Literal  # python >=3.8
 else:
     from typing_extensions import Literal
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime as dt
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode
 from dateutil.parser import isoparse
 
+import httpx
+import orjson
 import pandas as pd
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
-from tqdm.auto import trange
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from tqdm.auto import tqdm
 
 from quantnote_api import models
 from quantnote_api.models import unmarshal
@@ -29,6 +35,72 @@ from quantnote_api.models import unmarshal
 Timeframes = Literal["M1", "M5", "M10", "M15", "M30", "H1", "H4", "H12", "D1", "W1", "MN1"]
 
 
+def _candle_steps(limits: Dict[str, int], candle_seconds: Dict[str, int], candle_limit: int) -> Dict[str, int]:
+    """
+    Returns the longest time interval (in seconds) of one request for each resolution.
+    """
+    return {resolution: min(limit, candle_seconds[resolution] * candle_limit) for resolution, limit in limits.items()}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(date: str) -> int:
+    """
+    Converts the ISO formatted date to the unix timestamp, dates repeated across calls are parsed only once.
+    """
+    try:
+        return int(dt.fromisoformat(date.replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return int(isoparse(date).timestamp())
+
+
+# converters of the exact types of dates, subclasses (e.g. pandas.Timestamp) fall back to isinstance checks
+_DATE_CONVERTERS = {
+    int: int,
+    float: int,
+    str: _parse_date,
+    dt: lambda date: int(date.timestamp()),
+}
+
+
+_SESSIONS: Dict[int, httpx.Client] = {}
+_SESSION_REFERENCES: Dict[httpx.Client, int] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _acquire_session(timeout_repetitions: int, headers: Dict[str, str]) -> httpx.Client:
+    """
+    Returns the shared session for the given number of retries, keeping its connections alive across clients.
+    """
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(timeout_repetitions)
+        if session is None:
+            session = _SESSIONS[timeout_repetitions] = httpx.Client(
+                headers=headers,
+                transport=httpx.HTTPTransport(http2=True, retries=timeout_repetitions),
+            )
+        _SESSION_REFERENCES[session] = _SESSION_REFERENCES.get(session, 0) + 1
+        return session
+
+
+def _release_session(session: httpx.Client) -> None:
+    """
+    Closes the session once no client uses it.
+    """
+    with _SESSIONS_LOCK:
+        references = _SESSION_REFERENCES.pop(session, 1) - 1
+        if references > 0:
+            _SESSION_REFERENCES[session] = references
+            return
+        for key, shared_session in list(_SESSIONS.items()):
+            if shared_session is session:
+                del _SESSIONS[key]
+    session.close()
+
+
+# clients whose calls skip the validation in the current context (thread or asyncio task), see QuantNoteApi.trusted
+_TRUSTED_CLIENTS: contextvars.ContextVar = contextvars.ContextVar("trusted_clients", default=())
+
+
 class QuantNoteApi:
     """
     Main rest API client library class.
@@ -40,14 +112,38 @@ class QuantNoteApi:
     
     headers: Dict[str, str]
         Headers for requests.
+
+    timeout_repetitions: int
+        Number of retries of a request failing to connect or answered with one of ``RETRY_STATUSES``. Unlike with
+        the former urllib3 retries, a request timing out while reading the response is not retried.
+
+    max_workers: int
+        Maximum number of threads sending the requests of one time series concurrently.
+
+    cache_ttl: float
+        Number of seconds for which responses of rarely changing endpoints are cached; 0 disables the cache.
+
+    cache_ttls: Dict[str, float]
+        Cache TTLs of specific methods by their names (or "time_series" for the time series requests), overriding
+        ``cache_ttl`` (see ``CACHE_TTLS``). The slices of time series are cached only on demand, by a positive
+        "time_series" TTL in ``cache_ttl_overrides``, as long series would keep large payloads in memory.
+
+    trust_inputs: bool
+        Whether the parameters of all methods are passed unvalidated, as with ``validate_params=False``; contracts and
+        unix timestamps have to be given then.
     """
 
+    __slots__ = ("auth_token", "timeout_repetitions", "split_request", "headers", "api_server", "_assets",
+                 "_assets_list", "_symbol_index", "_session", "timeout", "max_workers", "_executor", "cache_ttl",
+                 "cache_ttls", "_cache", "_cache_lock", "_trust_inputs")
+
     DEFAULT_API_SERVER = "https://api.helixir.io/"
     API_VERSION = "v1"
 
     DATA_EPOCH = dt.fromisoformat("2021-04-12T13:45:00+02:00")
+    DATA_EPOCH_TIMESTAMP = int(DATA_EPOCH.timestamp())
     AGAINSTS = [None, "USD", "PEG"]
-    SORT_SUPPORTED_COLUMNS = [
+    SORT_SUPPORTED_COLUMNS = frozenset({
         "market_cap",
         "liquidity_usd",
         "name",
@@ -59,17 +155,48 @@ class QuantNoteApi:
 
         "time",
         "created_at",
-    ]
-    CHAIN_SUPPORTED_VALUES = [
-        56, 1, 137, 43114, 250,
-        "BSC", "ETH", "POLYGON", "AVAX", "FTM",
-        "bsc", "eth", "polygon", "avax", "ftm",
-        "56", "1", "137", "43114", "250",
-    ]
+    })
+    SORT_SUPPORTED_ORDERS = frozenset({"+", "-", "asc", "desc"})
+    TOKENS_SORT_COLUMNS = frozenset({
+        "chain", "circulating_supply", "contract", "decimals", "liquidity_usd", "market_cap", "name",
+        "price_change_24_h", "price_change_7_d", "price_peg", "price_usd", "symbol", "total_supply", "volume_24_h",
+    })
+    SWAPS_SORT_COLUMNS = frozenset({"amount_0", "amount_1", "time", "token_contract", "token_symbol"})
+    RESOLUTION_SUPPORTED_VALUES = frozenset(Timeframes.__args__)
+    CHAIN_MAP = {
+        56: 56, "BSC": 56, "bsc": 56, "56": 56,
+        1: 1, "ETH": 1, "eth": 1, "1": 1,
+        137: 137, "POLYGON": 137, "polygon": 137, "137": 137,
+        43114: 43114, "AVAX": 43114, "avax": 43114, "43114": 43114,
+        250: 250, "FTM": 250, "ftm": 250, "250": 250,
+    }
+    CHAIN_SUPPORTED_VALUES = list(CHAIN_MAP)
     CHAINS_NUMBER = 5
     LIMIT_LIMITS = (1, 500)
     PAGE_LIMITS = (1, 922337203685477581)
     CANDLE_LIMIT = 5000
+    RETRY_STATUSES = (408, 429, 500, 503, 504)
+    RETRY_BACKOFF_FACTOR = 1
+    # default cache TTLs of the methods whose data change faster than the rest, the price is cached only on demand
+    CACHE_TTLS = {
+        "get_assets": 3600,
+        # quotes, TVL and APR/APY figures are cached only to dedupe the calls of one batch or snapshot
+        "get_farms": 5,
+        "get_holders": 30,
+        "get_lp_token": 5,
+        "get_market_cap": 15,
+        "get_pairs": 60,
+        "get_pools_info": 5,
+        "get_price": 0,
+        "get_token": 5,
+        # slices of all time series, except the live tail ending at the current time; a 5000 candle slice takes
+        # megabytes once decoded, so they are cached only on demand
+        "time_series": 0,
+    }
+    CACHE_MAX_SIZE = 4096
+    # names of the token time series of the derived methods, used in the errors of empty series
+    SERIES_TITLES = {"prices": "Price", "volumes": "Volume", "addresses": "Addresses", "swaps": "Swaps"}
+    INT32_MAX = 2 ** 31 - 1
     candle_seconds = {
         "M1": 1 * 60,
         "M5": 5 * 60,
@@ -106,7 +233,12 @@ class QuantNoteApi:
         "D1": 24 * 60 * 60 * 30,  # 30 days
     }
 
-    def __init__(self, auth_token: str, timeout_repetitions: int = 5, split_request: bool = True, timeout: float = 60):
+    candle_steps = _candle_steps(candle_limits, candle_seconds, CANDLE_LIMIT)
+    strict_candle_steps = _candle_steps(strict_candle_limits, candle_seconds, CANDLE_LIMIT)
+
+    def __init__(self, auth_token: str, timeout_repetitions: int = 5, split_request: bool = True, timeout: float = 60,
+                 max_workers: int = 16, cache_ttl: float = 300, cache_ttl_overrides: Dict[str, float] = None,
+                 trust_inputs: bool = False):
         self.auth_token = auth_token
         self.timeout_repetitions = timeout_repetitions
         self.split_request = split_request
@@ -115,12 +247,19 @@ class QuantNoteApi:
             "User-Agent": "QuantNoteClient"
         }
         self.api_server = self.DEFAULT_API_SERVER + self.API_VERSION
-        self.assets_list = None
-        self._session = requests.Session()
-        retries = Retry(total=timeout_repetitions, backoff_factor=1, status_forcelist=[408, 429, 500, 503, 504])
-        self._session.mount("https://", HTTPAdapter(max_retries=retries))
-        self._session.headers.update(self.headers)
+        self._assets = None
+        self._assets_list = None
+        self._symbol_index = None
+        self._session = _acquire_session(timeout_repetitions, self.headers)
         self.timeout = timeout
+        self.max_workers = max_workers
+        self._executor = None
+        self.cache_ttl = cache_ttl
+        self.cache_ttls = dict(self.CACHE_TTLS) if cache_ttl else {}
+        self.cache_ttls.update(cache_ttl_overrides or {})
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.trust_inputs = trust_inputs
 
     def __enter__(self):
         return self
@@ -129,64 +268,388 @@ class QuantNoteApi:
         self.close()
 
     def close(self):
-        self._session.close()
+        if self._session is not None:
+            _release_session(self._session)
+            self._session = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
-    def _handle_candle_response(self, response_type: str, endpoint: str, method: str = "GET",
-                                params: Dict[str, Union[int, str]] = None, data=None, timeout: float = None):
-        params["resolution"] = params["resolution"].upper()
+    @property
+    def trust_inputs(self) -> bool:
+        return self._trust_inputs or self in _TRUSTED_CLIENTS.get()
+
+    @trust_inputs.setter
+    def trust_inputs(self, trust_inputs: bool) -> None:
+        self._trust_inputs = trust_inputs
+
+    @contextlib.contextmanager
+    def trusted(self):
+        """
+        Skips the validation of parameters within the block, e.g. in loops over already validated contracts. Only the
+        calls of the current thread (or asyncio task) are trusted, the other users of the client still validate.
+        """
+        token = _TRUSTED_CLIENTS.set(_TRUSTED_CLIENTS.get() + (self,))
+        try:
+            yield self
+        finally:
+            _TRUSTED_CLIENTS.reset(token)
+
+    def _iter_pages(self, get_page: functools.partial, limit: int,
+                    key: Callable[[models.AnyDefinition], Hashable] = None) -> Iterator[models.AnyDefinition]:
+        """
+        Yields the items of all pages in order, skipping items whose key was already seen. After the first page, the
+        following ones are fetched concurrently, max_workers pages at a time, until a page is not full; the pages
+        still pending when the iteration stops (also when it is closed early) are cancelled.
+        """
+        executor = self._get_executor()
+        seen = set()
+        page = self.PAGE_LIMITS[0]
+        window = 1
+        futures = []
+        try:
+            while True:
+                futures = [executor.submit(get_page, page=page + offset) for offset in range(window)]
+                for future in futures:
+                    items = future.result() or []
+                    for item in items:
+                        if key is not None:
+                            item_key = key(item)
+                            if item_key in seen:
+                                continue
+                            seen.add(item_key)
+                        yield item
+                    if len(items) < limit:
+                        return
+                page += window
+                window = self.max_workers
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _candle_slices(self, endpoint: str, params: Dict[str, Union[int, str]]) -> List[Tuple[int, int, bool]]:
+        """
+        Prepares the parameters of a candle request and splits its time interval into slices meeting the limit; each
+        slice is flagged whether it is the live tail ending at the current time.
+        """
+        resolution = params["resolution"] = params["resolution"].upper()
         if "active_addresses" in endpoint or "moves" in endpoint:
-            step = self.strict_candle_limits[params["resolution"]]
+            step = self.strict_candle_steps[resolution]
         else:
-            step = self.candle_limits[params["resolution"]]
-        step = min(step, self.candle_seconds[params["resolution"]] * self.CANDLE_LIMIT)
+            step = self.candle_steps[resolution]
 
-        if self.auth_token != "":
-            if params is None:
-                params = {}
-            params["token"] = self.auth_token
+        now = int(time.time())
+        from_ = self.DATA_EPOCH_TIMESTAMP if params["from"] is None else int(params["from"])
+        to = now if params["to"] is None else min(int(params["to"]), now)
 
-        if not self.split_request:
-            delta = params["from"] - params["to"]
-            if delta / self.candle_seconds[params["resolution"]] > self.CANDLE_LIMIT or delta > step:
-                raise Exception(
-                    f"Given time interval is too long for given resolution (max number of candles is {self.CANDLE_LIMIT}).")
-
-        result = []
-        if params["from"] is None:
-            params["from"] = self.DATA_EPOCH.timestamp()
-        if params["to"] is None or params["to"] > time.time():
-            params["to"] = int(time.time())
-        original_to = int(params["to"])
-        for i in trange(int(params["from"]), int(params["to"]), step, leave=False,
-                        desc="Iterating requests to meet the limit"):
-            params["from"] = i
-            params["to"] = min(i + step, original_to)
-            result += self._handle_response(response_type=response_type, endpoint=endpoint, method=method,
-                                            params=params, data=data, timeout=timeout)
-        return result
+        # the step never exceeds CANDLE_LIMIT candles of the resolution
+        if not self.split_request and to - from_ > step:
+            raise Exception(
+                f"Given time interval is too long for given resolution (max number of candles is {self.CANDLE_LIMIT}).")
+        # decided against the same clock reading that clamped the interval, the last slice grows until `now`
+        return [(i, min(i + step, to), to == now and i + step >= to) for i in range(from_, to, step)]
+
+    def _handle_candle_response(self, response_type: str, endpoint: str, method: str = "GET",
+                                params: Dict[str, Union[int, str]] = None, data=None, timeout: float = None):
+        return self._handle_candle_responses(response_type=response_type, queries={endpoint: (endpoint, params)},
+                                             method=method, data=data, timeout=timeout)[endpoint]
+
+    def _candle_requests(self, queries: Dict[Hashable, Tuple[str, Dict[str, Union[int, str]]]]) -> \
+            List[Tuple[Hashable, str, Dict[str, Union[int, str]], bool]]:
+        """
+        Splits the time series queries into requests (absolute url, query parameters and live tail flag by key)
+        meeting the limit.
+        """
+        requests = []
+        for key, (endpoint, params) in queries.items():
+            absolute_url = f"{self.api_server}/{endpoint}"
+            for from_, to, live in self._candle_slices(endpoint, params):
+                requests.append((key, absolute_url, self._query_params({**params, "from": from_, "to": to}), live))
+        return requests
+
+    def _handle_candle_responses(self, response_type: Union[str, Dict[Hashable, str]],
+                                 queries: Dict[Hashable, Tuple[str, Dict[str, Union[int, str]]]],
+                                 method: str = "GET", data=None, timeout: float = None,
+                                 required: Dict[Hashable, str] = None) -> Dict[Hashable, list]:
+        """
+        Fetches the time series of all queries (endpoint and parameters by key) with one pool of requests; the
+        response type is either shared or given by the keys of the queries. Once a required series (name by key)
+        is complete and empty, the pending requests are cancelled and ValueError is raised.
+        """
+        response_types = self._response_types(response_type, queries)
+        requests = self._candle_requests(queries)
+        remaining = Counter(key for key, *_ in requests)
+        slices = [None] * len(requests)
+        if len(requests) == 1:
+            key, absolute_url, params, live = requests[0]
+            self._collect_slice(requests, slices, remaining, 0, required,
+                                self._candle_slice(response_types[key], absolute_url, method=method, params=params,
+                                                   data=data, timeout=timeout, live=live))
+            return self._joined_slices(queries, requests, slices)
+
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self._candle_slice, response_types[key], absolute_url, method=method, params=params,
+                            data=data, timeout=timeout, live=live): index
+            for index, (key, absolute_url, params, live) in enumerate(requests)
+        }
+        try:
+            for future in tqdm(as_completed(futures), total=len(futures), leave=False,
+                               desc="Iterating requests to meet the limit", disable=len(futures) < 3):
+                self._collect_slice(requests, slices, remaining, futures[future], required, future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return self._joined_slices(queries, requests, slices)
+
+    @classmethod
+    def _collect_slice(cls, requests: List[Tuple[Hashable, str, Dict[str, Union[int, str]], bool]],
+                       slices: List[list], remaining: Counter, index: int, required: Dict[Hashable, str],
+                       items: list) -> None:
+        """
+        Stores the fetched slice of the request; raises ValueError if it completes a required series with no data.
+        """
+        slices[index] = items
+        key = requests[index][0]
+        remaining[key] -= 1
+        if required and key in required and not remaining[key]:
+            cls._require_nonempty(any(items for (other, *_), items in zip(requests, slices) if other == key),
+                                  required[key])
+
+    @staticmethod
+    def _require_nonempty(data, name: str) -> None:
+        """
+        Stops the execution if the (time series) data are empty, there is nothing to continue with.
+        """
+        if not data:
+            raise ValueError(f"{name} data are empty. It does not make sense to continue.")
+
+    @staticmethod
+    def _joined_slices(queries: Dict[Hashable, object],
+                       requests: List[Tuple[Hashable, str, Dict[str, Union[int, str]], bool]],
+                       slices: List[list]) -> Dict[Hashable, list]:
+        results = {key: [] for key in queries}
+        for (key, *_), items in zip(requests, slices):
+            results[key].extend(items)
+        return results
+
+    @staticmethod
+    def _response_types(response_type: Union[str, Dict[Hashable, str]], queries: Dict[Hashable, object]) -> \
+            Dict[Hashable, str]:
+        if isinstance(response_type, dict):
+            return response_type
+        return dict.fromkeys(queries, response_type)
+
+    def _map_result(self, result, function: Callable):
+        """
+        Applies the function to the result of a request method, once it is available.
+        """
+        return function(result)
+
+    def _candle_slice(self, response_type: str, absolute_url: str, method: str = "GET",
+                      params: Dict[str, Union[int, str]] = None, data=None, timeout: float = None,
+                      live: bool = False) -> list:
+        """
+        Fetches one slice of a time series and unmarshals it as soon as it arrives, so its decoded JSON is released
+        before the other slices are collected.
+        """
+        cache_key, ttl = self._slice_cache_key(method, absolute_url, params, live)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return self._unmarshal_data(response_type, cached[1]) or []
+
+        response_data = self._request(absolute_url, method=method, params=params, data=data, timeout=timeout)
+        if cache_key is not None:
+            self._cache_store(cache_key, ttl, response_data)
+        return self._unmarshal_data(response_type, response_data) or []
+
+    def _slice_cache_key(self, method: str, absolute_url: str, params: Dict[str, Union[int, str]], live: bool) -> \
+            Tuple[Hashable, float]:
+        """
+        Returns the cache key and TTL of the time series slice; the live tail (flagged by _candle_slices), ending at
+        the current time, is not cached as it would never be requested again.
+        """
+        if live:
+            return None, 0
+        return self._cache_key("time_series", method, absolute_url, params)
 
     def _handle_response(self, response_type: str, endpoint: str, method: str = "GET",
                          params: Dict[str, Union[int, str]] = None, data=None, timeout_repetitions: int = None,
-                         timeout: float = None) -> Type[models.AnyDefinition]:
+                         timeout: float = None, cache: str = None) -> Type[models.AnyDefinition]:
+        """
+        Sends the request of the endpoint and returns its unmarshalled data; ``cache`` names the method whose cache
+        TTL applies to the response.
+        """
+        params = self._query_params(params)
+        cache_key, ttl = self._cache_key(cache, method, endpoint, params)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return self._unmarshal_data(response_type, cached[1])
+
+        data = self._request(f"{self.api_server}/{endpoint}", method=method, params=params, data=data,
+                             timeout_repetitions=timeout_repetitions, timeout=timeout)
+        if cache_key is not None:
+            self._cache_store(cache_key, ttl, data)
+        return self._unmarshal_data(response_type, data)
+
+    def _handle_responses(self, response_type: str, queries: Dict[Hashable, Tuple[str, Dict[str, Union[int, str]]]],
+                          method: str = "GET", cache: str = None) -> Dict[Hashable, Type[models.AnyDefinition]]:
+        """
+        Fetches the responses of all queries (endpoint and parameters by key) concurrently.
+        """
+        executor = self._get_executor()
+        futures = {
+            key: executor.submit(self._handle_response, response_type, endpoint, method=method, params=params,
+                                 cache=cache)
+            for key, (endpoint, params) in queries.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+    def _gather_calls(self, calls: Dict[Hashable, functools.partial]) -> Dict[Hashable, object]:
+        """
+        Runs the (single response) method calls concurrently and returns their results by key; the calls run in the
+        context of the caller, so they are trusted as it is.
+        """
+        executor = self._get_executor()
+        futures = {key: executor.submit(contextvars.copy_context().run, call) for key, call in calls.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+    def _request(self, absolute_url: str, method: str = "GET", params: Dict[str, Union[int, str]] = None, data=None,
+                 timeout_repetitions: int = None, timeout: float = None):
+        """
+        Sends the request (with the final query parameters) and returns the decoded response data.
+        """
         if timeout_repetitions is None:
             timeout_repetitions = self.timeout_repetitions
 
+        url = self._request_url(absolute_url, params)
+        content = self._request_content(data)
+        try:
+            for repetition in range(timeout_repetitions + 1):
+                response = self._session.request(method=method, url=url, content=content,
+                                                 timeout=timeout if timeout else self.timeout)
+                if response.status_code not in self.RETRY_STATUSES or repetition == timeout_repetitions:
+                    break
+                time.sleep(self._retry_delay(response, repetition))
+            data = orjson.loads(response.content)
+            response.raise_for_status()
+        except (httpx.HTTPError, ValueError) as err:
+            self._raise_api_error(data, err)
+        return data
+
+    def _retry_delay(self, response: httpx.Response, repetition: int) -> float:
+        """
+        Returns the seconds to wait before the retry; like urllib3, the first retry is immediate and the following ones
+        back off exponentially (0, 2, 4, 8, ... times RETRY_BACKOFF_FACTOR), but never sooner than the Retry-After
+        header of the response asks.
+        """
+        backoff = self.RETRY_BACKOFF_FACTOR * 2 ** repetition if repetition else 0
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return backoff
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return backoff
+        return max(delay, backoff)
+
+    @staticmethod
+    def _request_content(data) -> Union[bytes, str, None]:
+        if data is None or isinstance(data, (bytes, str)):
+            return data
+        return orjson.dumps(data)
+
+    def _cache_key(self, cache: str, method: str, endpoint: str,
+                   params: Dict[str, Union[int, str]] = None) -> Tuple[Hashable, float]:
+        """
+        Returns the cache key of the request and the TTL of the method named by ``cache``; the key is None if the
+        response is not to be cached.
+        """
+        ttl = self.cache_ttls.get(cache, self.cache_ttl) if cache else 0
+        if not ttl:
+            return None, ttl
+        if not params:
+            return (method, endpoint, None), ttl
+        # list values (sent as repeated keys) are hashed as tuples
+        items = frozenset((key, tuple(value) if isinstance(value, list) else value) for key, value in params.items())
+        return (method, endpoint, items), ttl
+
+    def _cache_lookup(self, cache_key: Hashable) -> Union[Tuple[float, object], None]:
+        """
+        Returns the cached (expiration, data) pair of the key, or None if it is missing or expired.
+        """
+        if cache_key is None:
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is None:
+                return None
+            if time.monotonic() > cached[0]:
+                del self._cache[cache_key]
+                return None
+            self._cache.move_to_end(cache_key)
+        return cached
+
+    def _cache_store(self, cache_key: Hashable, ttl: float, data) -> None:
+        """
+        Stores the data under the key; the least recently used entries, first in the cache, are dropped while they are
+        expired or the cache is over its size, so the expired responses are not kept until the size pushes them out.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            cache = self._cache
+            cache[cache_key] = (now + ttl, data)
+            cache.move_to_end(cache_key)
+            # the stored entry is last and not expired, so the loop stops at it at the latest
+            while len(cache) > self.CACHE_MAX_SIZE or now >= next(iter(cache.values()))[0]:
+                cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """
+        Drops all cached responses, so the following requests fetch fresh data.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _query_params(self, params: Dict[str, Union[int, str]] = None) -> Dict[str, Union[int, str]]:
         if self.auth_token != "":
             if params is None:
                 params = {}
             params["token"] = self.auth_token
-
-        absolute_url = f"{self.api_server}/{endpoint}"
-        try:
-            response = self._session.request(method=method, url=absolute_url, data=data, params=params,
-                                             timeout=timeout if timeout else self.timeout)
-            data = response.json()
-            response.raise_for_status()
-        except requests.exceptions.RequestException as err:
-            if isinstance(data, dict) and "errors" in data and "message" in data:
-                raise Exception(f"{data['message']} - {', '.join(data['errors'])}.")
-            raise SystemExit(err)
-
+        if params is not None:
+            # None values are left out and booleans are encoded as lowercase, as httpx did with the params
+            params = {
+                key: ("true" if value else "false") if isinstance(value, bool) else value
+                for key, value in params.items() if value is not None
+            }
+        return params
+
+    @staticmethod
+    def _request_url(absolute_url: str, params: Dict[str, Union[int, str]] = None) -> str:
+        """
+        Appends the query string to the url, a single urlencode call is cheaper than httpx merging the params; list
+        values are sent as repeated keys.
+        """
+        query = urlencode(params, doseq=True) if params else ""
+        return f"{absolute_url}?{query}" if query else absolute_url
+
+    @staticmethod
+    def _raise_api_error(data, err: Exception) -> None:
+        if isinstance(data, dict) and "errors" in data and "message" in data:
+            raise Exception(f"{data['message']} - {', '.join(data['errors'])}.")
+        raise SystemExit(err)
+
+    @staticmethod
+    def _unmarshal_data(response_type: str, data) -> Type[models.AnyDefinition]:
         if data == "" or data is None:
             warnings.warn("Desired data are empty.")
             return data
@@ -195,10 +658,31 @@ class QuantNoteApi:
 
         return unmarshal.unmarshal_json(response_type, data)
 
+    @property
+    def assets_list(self) -> pd.DataFrame:
+        """
+        Assets used for the translation of the symbol to the contract, None until they are fetched.
+        """
+        if self._assets_list is None and self._assets is not None:
+            self._assets_list = pd.DataFrame(self._assets)
+        return self._assets_list
+
     def _fill_assets(self) -> None:
         url = "assets"
-        self.assets_list = self._handle_response(response_type=None, endpoint=url, method="GET")
-        self.assets_list = pd.DataFrame(self.assets_list)
+        self._index_assets(self._request(f"{self.api_server}/{url}", method="GET", params=self._query_params()))
+
+    def _index_assets(self, data) -> None:
+        """
+        Stores the fetched assets by column and indexes their contracts by symbol and chain for the lookups.
+        """
+        assets = self._unmarshal_data(None, data) or []
+        columns = dict.fromkeys(column for asset in assets for column in asset)
+        self._assets = {column: [asset.get(column) for asset in assets] for column in columns}
+        self._assets_list = None
+        self._symbol_index = {}
+        for symbol, chain, contract in zip(self._assets.get("symbol", []), self._assets.get("chain", []),
+                                           self._assets.get("contract", [])):
+            self._symbol_index.setdefault(symbol, {}).setdefault(chain, []).append(contract)
 
     def _symbol_to_contract(self, symbol: str, chain: int = None) -> str:
         """
@@ -221,21 +705,21 @@ class QuantNoteApi:
         contract: str
             Contract token.
         """
-        if self.assets_list is None:
+        if self._symbol_index is None:
             self._fill_assets()
 
-        if symbol not in self.assets_list["symbol"].values:
+        chains = self._symbol_index.get(symbol)
+        if chains is None:
             raise Exception(f"Sorry, the entered symbol ({symbol}) is unknown.")
-        tmp = self.assets_list.loc[symbol == self.assets_list["symbol"]]
-        if tmp.shape[0] == 1:
-            return tmp.iloc[0]["contract"]
+        if len(chains) == 1:
+            contracts = next(iter(chains.values()))
+            if len(contracts) == 1:
+                return contracts[0]
 
-        chains = tmp["chain"].unique()
         if chain is not None and chain in chains:
-            tmp = self.assets_list.loc[chain == self.assets_list["chain"]]
-            if tmp.shape[0] == 1:
-                return tmp.iloc[0]["contract"]
-            contracts = tmp["contract"].values
+            contracts = chains[chain]
+            if len(contracts) == 1:
+                return contracts[0]
             raise Exception(
                 f"""Sorry, multiple contracts belong to the symbol ({symbol}) on the specified chain ({chain}).
         You must enter a specific contract. In this case, the following are available: {contracts}""")
@@ -259,6 +743,21 @@ class QuantNoteApi:
             self._validate_contract(contract)
         return contract
 
+    def _validate_symbols_contracts_chain(self, symbols: List[str], contracts: List[str], chain: Union[str, int],
+                                          validate_params: bool = True) -> Tuple[List[str], List[str]]:
+        """
+        Returns the keys of the batch results (contracts, or symbols if the contracts are not given) and the contracts.
+        """
+        if contracts is None:
+            if symbols is None:
+                raise ValueError("Either the symbols or the contracts have to be specified.")
+            return symbols, [self._validate_symbol_contract_chain(symbol, None, chain) for symbol in symbols]
+        if validate_params and not self.trust_inputs:
+            self._validate_chain(chain)
+            for contract in contracts:
+                self._validate_contract(contract)
+        return contracts, contracts
+
     def _validate_against(self, against: str) -> None:
         if against not in self.AGAINSTS:
             raise ValueError("Wrong value of parameter against.")
@@ -266,25 +765,32 @@ class QuantNoteApi:
     def _validate_date(self, date) -> dt.timestamp:
         if date is None:
             return date
-        if not isinstance(date, int):
-            date = int(isoparse(str(date)).timestamp())
-        if date < self.DATA_EPOCH.timestamp():
+        convert = _DATE_CONVERTERS.get(type(date))
+        if convert is not None:
+            date = convert(date)
+        elif isinstance(date, (int, float)):
+            date = int(date)
+        elif isinstance(date, dt):
+            date = int(date.timestamp())
+        else:
+            date = _parse_date(str(date))
+        if date < self.DATA_EPOCH_TIMESTAMP:
             warnings.warn(f"Data are available only from {self.DATA_EPOCH}.")
         return date
 
     def _validate_from__to(self, from_: Union[str, int, dt], to: Union[str, int, dt]):
         from_ = self._validate_date(from_)
         to = self._validate_date(to)
-        if to:
-            if to < self.DATA_EPOCH.timestamp():
-                raise ValueError(F"Sorry, data are available only from {self.DATA_EPOCH}. Please select a later date.")
-            if from_:
-                if to <= from_:
-                    raise ValueError("The to parameter must be greater than the parameter from_.")
+        if to is None:
+            return from_, to
+        if to < self.DATA_EPOCH_TIMESTAMP:
+            raise ValueError(F"Sorry, data are available only from {self.DATA_EPOCH}. Please select a later date.")
+        if from_ is not None and to <= from_:
+            raise ValueError("The to parameter must be greater than the parameter from_.")
         return from_, to
 
     def _validate_resolution(self, resolution: Timeframes) -> None:
-        if resolution not in ["M1", "M5", "M10", "M15", "M30", "H1", "H4", "H12", "D1", "W1", "MN1"]:
+        if resolution not in self.RESOLUTION_SUPPORTED_VALUES:
             raise ValueError("The resolution must be one of the allowed values.")
 
     def _validate_limit(self, limit: int) -> None:
@@ -302,7 +808,7 @@ class QuantNoteApi:
             raise ValueError("""We are sorry, but we are unable to process your page number. It is too big.
         Moreover, there aren"t that many sites.""")
 
-    def _validate_sort(self, sort: str, columns: List[str]) -> None:
+    def _validate_sort(self, sort: str, columns: Collection[str]) -> None:
         if not sort:
             return
         else:
@@ -313,14 +819,15 @@ class QuantNoteApi:
             col = sort[1:]
             order = sort[0]
         if col in self.SORT_SUPPORTED_COLUMNS and col in columns:
-            if order in ["+", "-", "asc", "desc"]:
+            if order in self.SORT_SUPPORTED_ORDERS:
                 return
         raise ValueError("The sort parameter must match the supported values.")
 
     def _validate_chain(self, chain: Union[str, int]) -> int:
-        if chain not in self.CHAIN_SUPPORTED_VALUES:
+        try:
+            return self.CHAIN_MAP[chain]
+        except (KeyError, TypeError):
             raise ValueError("The chain parameter must match the supported values.")
-        return self.CHAIN_SUPPORTED_VALUES[self.CHAIN_SUPPORTED_VALUES.index(chain) % self.CHAINS_NUMBER]
 
     def _validate_symbol_contract_against_from__to_resolution_chain(self, symbol: str, contract: str, against: str,
                                                                     from_, to,
@@ -347,11 +854,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
 
         url = f"chain/{chain}/farms"
-        return self._handle_response(response_type="List[FarmResponse]", endpoint=url, method="GET")
+        return self._handle_response(response_type="List[FarmResponse]", endpoint=url, method="GET", cache="get_farms")
 
     def get_optimizers_number(self, chain: Union[str, int] = "bsc", validate_params: bool = True) -> int:
         """
@@ -365,11 +872,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
 
         url = f"chain/{chain}/farms/optimizers/number"
-        return self._handle_response(response_type="int", endpoint=url, method="GET")
+        return self._handle_response(response_type="int", endpoint=url, method="GET", cache="get_optimizers_number")
 
     def get_yields_number(self, chain: Union[str, int] = "bsc", validate_params: bool = True) -> int:
         """
@@ -383,11 +890,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
 
         url = f"chain/{chain}/farms/yields/number"
-        return self._handle_response(response_type="int", endpoint=url, method="GET")
+        return self._handle_response(response_type="int", endpoint=url, method="GET", cache="get_yields_number")
 
     def get_pools(self, platform: str, chain: Union[str, int] = "bsc",
                   validate_params: bool = True) -> models.PoolsResponse:
@@ -404,11 +911,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
 
         url = f"chain/{chain}/farms/{platform}/pools"
-        return self._handle_response(response_type="PoolsResponse", endpoint=url, method="GET")
+        return self._handle_response(response_type="PoolsResponse", endpoint=url, method="GET", cache="get_pools")
 
     def get_pools_info(self, platform: str, chain: Union[str, int] = "bsc",
                        validate_params: bool = True) -> models.PoolsInfoResponse:
@@ -425,11 +932,12 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
 
         url = f"chain/{chain}/farms/{platform}/pools/info"
-        return self._handle_response(response_type="PoolsInfoResponse", endpoint=url, method="GET")
+        return self._handle_response(response_type="PoolsInfoResponse", endpoint=url, method="GET",
+                                     cache="get_pools_info")
 
     def get_lps(self, limit: int = None, page: int = None, sort: str = None, chain: Union[str, int] = "bsc",
                 validate_params: bool = True) -> List[models.TokenResponseExtended]:
@@ -450,13 +958,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
             self._validate_limit(limit)
             self._validate_page(page)
-            self._validate_sort(sort, columns=["chain", "circulating_supply", "contract", "decimals", "liquidity_usd",
-                                               "market_cap", "name", "price_change_24_h", "price_change_7_d",
-                                               "price_peg", "price_usd", "symbol", "total_supply", "volume_24_h"])
+            self._validate_sort(sort, columns=self.TOKENS_SORT_COLUMNS)
 
         query_params = {
             "limit": limit,
@@ -479,11 +985,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
 
         url = f"chain/{chain}/lps/number"
-        return self._handle_response(response_type="int", endpoint=url, method="GET")
+        return self._handle_response(response_type="int", endpoint=url, method="GET", cache="get_lps_number")
 
     def get_lp_token(self, symbol: str = None, contract: str = None, chain: Union[str, int] = "bsc",
                      validate_params: bool = True) -> models.LPTokenResponse:
@@ -503,11 +1009,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
 
         url = f"chain/{chain}/lps/{contract}"
-        return self._handle_response(response_type="LPTokenResponse", endpoint=url, method="GET")
+        return self._handle_response(response_type="LPTokenResponse", endpoint=url, method="GET", cache="get_lp_token")
 
     def get_lps_liquidity(self, symbol: str = None, contract: str = None, from_: Union[str, int, dt] = None,
                           to: Union[str, int, dt] = None, chain: Union[str, int] = "bsc", resolution: str = "H1",
@@ -534,7 +1040,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
             self._validate_resolution(resolution)
@@ -566,7 +1072,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
 
         url = f"chain/{chain}/lps/{contract}/price"
@@ -606,11 +1112,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
             self._validate_page(page)
-            self._validate_sort(sort, columns=["amount_0", "amount_1", "time", "token_contract", "token_symbol"])
+            self._validate_sort(sort, columns=self.SWAPS_SORT_COLUMNS)
             self._validate_limit(limit)
 
         query_params = {
@@ -647,13 +1153,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
             self._validate_limit(limit)
             self._validate_page(page)
-            self._validate_sort(sort, columns=["chain", "circulating_supply", "contract", "decimals", "liquidity_usd",
-                                               "market_cap", "name", "price_change_24_h", "price_change_7_d",
-                                               "price_peg", "price_usd", "symbol", "total_supply", "volume_24_h"])
+            self._validate_sort(sort, columns=self.TOKENS_SORT_COLUMNS)
 
         query_params = {
             "extended": extended,
@@ -677,11 +1181,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
 
         url = f"chain/{chain}/tokens/number"
-        return self._handle_response(response_type="int", endpoint=url, method="GET")
+        return self._handle_response(response_type="int", endpoint=url, method="GET", cache="get_tokens_number")
 
     def get_token(self, symbol: str = None, contract: str = None, extended: bool = None, chain: Union[str, int] = "bsc",
                   validate_params: bool = True) -> models.TokenResponse:
@@ -703,14 +1207,15 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
 
         query_params = {
             "extended": extended,
         }
         url = f"chain/{chain}/tokens/{contract}"
-        return self._handle_response(response_type="TokenResponse", endpoint=url, method="GET", params=query_params)
+        return self._handle_response(response_type="TokenResponse", endpoint=url, method="GET", params=query_params,
+                                     cache="get_token")
 
     def get_active_addresses(self, symbol: str = None, contract: str = None, from_: Union[str, int, dt] = None,
                              to: Union[str, int, dt] = None, chain: Union[str, int] = "bsc", resolution: str = "H1",
@@ -737,7 +1242,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
             self._validate_resolution(resolution)
@@ -781,11 +1286,19 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract, from_, to = self._validate_symbol_contract_against_from__to_resolution_chain(symbol, contract,
                                                                                                    against, from_, to,
                                                                                                    resolution, chain)
 
+        url, query_params = self._candles_query(contract=contract, from_=from_, to=to, chain=chain,
+                                                resolution=resolution, against=against, platform=platform)
+        return self._handle_candle_response(response_type="List[TokenPriceResponse]", endpoint=url, method="GET",
+                                            params=query_params)
+
+    @staticmethod
+    def _candles_query(contract: str, from_: int, to: int, chain: Union[str, int], resolution: str, against: str,
+                       platform: str) -> Tuple[str, Dict[str, Union[int, str]]]:
         query_params = {
             "against": against,
             "from": from_,
@@ -794,8 +1307,55 @@ class QuantNoteApi:
             "platform": platform,
         }
         url = f"chain/{chain}/tokens/{contract}/candles"
-        return self._handle_candle_response(response_type="List[TokenPriceResponse]", endpoint=url, method="GET",
-                                            params=query_params)
+        return url, query_params
+
+    def get_candles_batch(self, symbols: List[str] = None, contracts: List[str] = None,
+                          from_: Union[str, int, dt] = None, to: Union[str, int, dt] = None,
+                          chain: Union[str, int] = "bsc", resolution: str = "H1", against: str = None,
+                          platform: str = None, validate_params: bool = True) -> \
+            Dict[str, List[models.TokenPriceResponse]]:
+        """
+        Returns price time series for multiple tokens for some time range, the requests are sent concurrently.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        contracts : List[str]
+            Contract addresses of queried tokens.
+        symbols : List[str], default None
+            Symbols of the tokens, used if the contracts are not given.
+            Each has to be unique on the selected chain.
+        against : str
+            If price should be against PEG or USD; default value is USD.
+        from_ : int
+            Unix timestamp of start of wanted time interval, if omitted start of unix time is used.
+        to : int
+            Unix timestamp of end of wanted time interval, if omitted recent time is used.
+        resolution : str
+            Candle resolution.
+        platform : str
+            Comma separated platforms from which prices are taken, as a default value is taken the biggest platform on chain.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+
+        Returns
+        -------
+        data: Dict[str, List[models.TokenPriceResponse]]
+            Price time series by the given contract (or symbol, if the contracts are not given).
+        """
+        keys, contracts = self._validate_symbols_contracts_chain(symbols, contracts, chain, validate_params)
+        if validate_params and not self.trust_inputs:
+            self._validate_against(against)
+            from_, to = self._validate_from__to(from_=from_, to=to)
+            self._validate_resolution(resolution)
+
+        queries = {
+            key: self._candles_query(contract=contract, from_=from_, to=to, chain=chain, resolution=resolution,
+                                     against=against, platform=platform)
+            for key, contract in zip(keys, contracts)
+        }
+        return self._handle_candle_responses(response_type="List[TokenPriceResponse]", queries=queries, method="GET")
 
     def get_holders(self, symbol: str = None, contract: str = None, chain: Union[str, int] = "bsc",
                     validate_params: bool = True) -> int:
@@ -815,11 +1375,38 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
 
         url = f"chain/{chain}/tokens/{contract}/holders"
-        return self._handle_response(response_type="int", endpoint=url, method="GET")
+        return self._handle_response(response_type="int", endpoint=url, method="GET", cache="get_holders")
+
+    def get_holders_batch(self, symbols: List[str] = None, contracts: List[str] = None,
+                          chain: Union[str, int] = "bsc", validate_params: bool = True) -> Dict[str, int]:
+        """
+        Get number of all holders for multiple tokens, the requests are sent concurrently.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        contracts : List[str]
+            Contract addresses of queried tokens.
+        symbols : List[str], default None
+            Symbols of the tokens, used if the contracts are not given.
+            Each has to be unique on the selected chain.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+
+        Returns
+        -------
+        data: Dict[str, int]
+            Numbers of holders by the given contract (or symbol, if the contracts are not given).
+        """
+        keys, contracts = self._validate_symbols_contracts_chain(symbols, contracts, chain, validate_params)
+
+        queries = {key: (f"chain/{chain}/tokens/{contract}/holders", None) for key, contract in zip(keys, contracts)}
+        return self._handle_responses(response_type="int", queries=queries, method="GET", cache="get_holders")
 
     def get_market_cap(self, symbol: str = None, contract: str = None, chain: Union[str, int] = "bsc",
                        validate_params: bool = True) -> float:
@@ -839,11 +1426,38 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
 
         url = f"chain/{chain}/tokens/{contract}/market_cap"
-        return self._handle_response(response_type="float", endpoint=url, method="GET")
+        return self._handle_response(response_type="float", endpoint=url, method="GET", cache="get_market_cap")
+
+    def get_market_caps_batch(self, symbols: List[str] = None, contracts: List[str] = None,
+                              chain: Union[str, int] = "bsc", validate_params: bool = True) -> Dict[str, float]:
+        """
+        Calculate recent market capitalization of multiple tokens, the requests are sent concurrently.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        contracts : List[str]
+            Contract addresses of queried tokens.
+        symbols : List[str], default None
+            Symbols of the tokens, used if the contracts are not given.
+            Each has to be unique on the selected chain.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+
+        Returns
+        -------
+        data: Dict[str, float]
+            Market capitalizations by the given contract (or symbol, if the contracts are not given).
+        """
+        keys, contracts = self._validate_symbols_contracts_chain(symbols, contracts, chain, validate_params)
+
+        queries = {key: (f"chain/{chain}/tokens/{contract}/market_cap", None) for key, contract in zip(keys, contracts)}
+        return self._handle_responses(response_type="float", queries=queries, method="GET", cache="get_market_cap")
 
     def get_pairs(self, symbol: str = None, contract: str = None, chain: Union[str, int] = "bsc",
                   validate_params: bool = True) -> Dict[str, models.LPTokenResponse]:
@@ -863,11 +1477,41 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
 
         url = f"chain/{chain}/tokens/{contract}/pairs"
-        return self._handle_response(response_type="Dict[str, LPTokenResponse]", endpoint=url, method="GET")
+        return self._handle_response(response_type="Dict[str, LPTokenResponse]", endpoint=url, method="GET",
+                                     cache="get_pairs")
+
+    def get_pairs_batch(self, symbols: List[str] = None, contracts: List[str] = None,
+                        chain: Union[str, int] = "bsc", validate_params: bool = True) -> \
+            Dict[str, Dict[str, models.LPTokenResponse]]:
+        """
+        Returns Pancake token pairs (with Peg(e.g. BNB) and USD) for multiple tokens, the requests are sent concurrently.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        contracts : List[str]
+            Contract addresses of queried tokens.
+        symbols : List[str], default None
+            Symbols of the tokens, used if the contracts are not given.
+            Each has to be unique on the selected chain.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+
+        Returns
+        -------
+        data: Dict[str, Dict[str, models.LPTokenResponse]]
+            Token pairs by the given contract (or symbol, if the contracts are not given).
+        """
+        keys, contracts = self._validate_symbols_contracts_chain(symbols, contracts, chain, validate_params)
+
+        queries = {key: (f"chain/{chain}/tokens/{contract}/pairs", None) for key, contract in zip(keys, contracts)}
+        return self._handle_responses(response_type="Dict[str, LPTokenResponse]", queries=queries, method="GET",
+                                      cache="get_pairs")
 
     def get_price(self, symbol: str = None, contract: str = None, chain: Union[str, int] = "bsc", against: str = None,
                   validate_params: bool = True) -> float:
@@ -889,7 +1533,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
             self._validate_against(against)
 
@@ -897,7 +1541,43 @@ class QuantNoteApi:
             "against": against,
         }
         url = f"chain/{chain}/tokens/{contract}/price"
-        return self._handle_response(response_type="float", endpoint=url, method="GET", params=query_params)
+        return self._handle_response(response_type="float", endpoint=url, method="GET", params=query_params,
+                                     cache="get_price")
+
+    def get_prices_batch(self, symbols: List[str] = None, contracts: List[str] = None,
+                         chain: Union[str, int] = "bsc", against: str = None, validate_params: bool = True) -> \
+            Dict[str, float]:
+        """
+        Get the most recent prices of multiple tokens, the requests are sent concurrently.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        contracts : List[str]
+            Contract addresses of queried tokens.
+        symbols : List[str], default None
+            Symbols of the tokens, used if the contracts are not given.
+            Each has to be unique on the selected chain.
+        against : str
+            If price should be against PEG or USD; default value is USD.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+
+        Returns
+        -------
+        data: Dict[str, float]
+            Prices by the given contract (or symbol, if the contracts are not given).
+        """
+        keys, contracts = self._validate_symbols_contracts_chain(symbols, contracts, chain, validate_params)
+        if validate_params and not self.trust_inputs:
+            self._validate_against(against)
+
+        queries = {
+            key: (f"chain/{chain}/tokens/{contract}/price", {"against": against})
+            for key, contract in zip(keys, contracts)
+        }
+        return self._handle_responses(response_type="float", queries=queries, method="GET", cache="get_price")
 
     def get_price_change(self, symbol: str = None, contract: str = None, chain: Union[str, int] = "bsc",
                          interval: str = "D1", against: str = None, validate_params: bool = True) -> float:
@@ -921,7 +1601,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
             self._validate_against(against)
             self._validate_resolution(interval)
@@ -933,6 +1613,44 @@ class QuantNoteApi:
         url = f"chain/{chain}/tokens/{contract}/price/change"
         return self._handle_response(response_type="float", endpoint=url, method="GET", params=query_params)
 
+    def get_price_changes_batch(self, symbols: List[str] = None, contracts: List[str] = None,
+                                chain: Union[str, int] = "bsc", interval: str = "D1", against: str = None,
+                                validate_params: bool = True) -> Dict[str, float]:
+        """
+        Get price changes in percent of multiple tokens for given time interval, the requests are sent concurrently.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        contracts : List[str]
+            Contract addresses of queried tokens.
+        symbols : List[str], default None
+            Symbols of the tokens, used if the contracts are not given.
+            Each has to be unique on the selected chain.
+        against : str
+            If price should be against PEG or USD; default value is USD.
+        interval : str
+            Historic interval for calculating change; default value is D1.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+
+        Returns
+        -------
+        data: Dict[str, float]
+            Price changes by the given contract (or symbol, if the contracts are not given).
+        """
+        keys, contracts = self._validate_symbols_contracts_chain(symbols, contracts, chain, validate_params)
+        if validate_params and not self.trust_inputs:
+            self._validate_against(against)
+            self._validate_resolution(interval)
+
+        queries = {
+            key: (f"chain/{chain}/tokens/{contract}/price/change", {"against": against, "interval": interval})
+            for key, contract in zip(keys, contracts)
+        }
+        return self._handle_responses(response_type="float", queries=queries, method="GET")
+
     def get_swaps(self, from_wallet: str = None, lp_token: str = None, limit: int = None, page: int = None,
                   sort: str = None, symbol: str = None, contract: str = None, from_: Union[str, int, dt] = None,
                   to: Union[str, int, dt] = None, chain: Union[str, int] = "bsc", validate_params: bool = True) -> List[
@@ -967,11 +1685,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
             self._validate_page(page)
-            self._validate_sort(sort, columns=["amount_0", "amount_1", "time", "token_contract", "token_symbol"])
+            self._validate_sort(sort, columns=self.SWAPS_SORT_COLUMNS)
             self._validate_limit(limit)
 
         query_params = {
@@ -1012,7 +1730,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
             self._validate_resolution(resolution)
@@ -1051,7 +1769,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
             self._validate_resolution(resolution)
@@ -1085,7 +1803,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
             self._validate_resolution(interval)
 
@@ -1115,7 +1833,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract = self._validate_symbol_contract_chain(symbol, contract, chain)
             self._validate_resolution(interval)
 
@@ -1125,6 +1843,41 @@ class QuantNoteApi:
         url = f"chain/{chain}/tokens/{contract}/volumes/latest"
         return self._handle_response(response_type="float", endpoint=url, method="GET", params=query_params)
 
+    def get_volumes_latest_batch(self, symbols: List[str] = None, contracts: List[str] = None,
+                                 chain: Union[str, int] = "bsc", interval: str = "D1",
+                                 validate_params: bool = True) -> Dict[str, float]:
+        """
+        Get volume of all trades in given interval for multiple tokens, the requests are sent concurrently.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        contracts : List[str]
+            Contract addresses of queried tokens.
+        symbols : List[str], default None
+            Symbols of the tokens, used if the contracts are not given.
+            Each has to be unique on the selected chain.
+        interval : str
+            Interval for calculating volume; default value is D1.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+
+        Returns
+        -------
+        data: Dict[str, float]
+            Volumes by the given contract (or symbol, if the contracts are not given).
+        """
+        keys, contracts = self._validate_symbols_contracts_chain(symbols, contracts, chain, validate_params)
+        if validate_params and not self.trust_inputs:
+            self._validate_resolution(interval)
+
+        queries = {
+            key: (f"chain/{chain}/tokens/{contract}/volumes/latest", {"interval": interval})
+            for key, contract in zip(keys, contracts)
+        }
+        return self._handle_responses(response_type="float", queries=queries, method="GET")
+
     def get_wallets_number(self, chain: Union[str, int] = "bsc", validate_params: bool = True) -> int:
         """
         Returns number of unique addresses saved in DB.
@@ -1137,11 +1890,11 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
 
         url = f"chain/{chain}/wallets/number"
-        return self._handle_response(response_type="int", endpoint=url, method="GET")
+        return self._handle_response(response_type="int", endpoint=url, method="GET", cache="get_wallets_number")
 
     def get_wallets_farm_portfolio(self, address: str, chain: Union[str, int] = "bsc", validate_params: bool = True) -> \
             Dict[str, List[models.FarmsPortfolioResponse]]:
@@ -1158,7 +1911,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
 
         url = f"chain/{chain}/wallets/{address}/farm_portfolio"
@@ -1184,7 +1937,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
             self._validate_chain(chain)
 
@@ -1216,7 +1969,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
             self._validate_chain(chain)
 
@@ -1252,7 +2005,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
             self._validate_chain(chain)
             self._validate_resolution(resolution)
@@ -1282,7 +2035,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             self._validate_chain(chain)
 
         url = f"chain/{chain}/wallets/{address}/portfolio"
@@ -1319,9 +2072,9 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
-            self._validate_sort(sort, columns=["amount_0", "amount_1", "time", "token_contract", "token_symbol"])
+            self._validate_sort(sort, columns=self.SWAPS_SORT_COLUMNS)
             self._validate_page(page)
             self._validate_chain(chain)
             self._validate_limit(limit)
@@ -1363,7 +2116,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
             self._validate_page(page)
             self._validate_chain(chain)
@@ -1399,7 +2152,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_, to = self._validate_from__to(from_, to)
             self._validate_chain(chain)
 
@@ -1424,7 +2177,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             chain = self._validate_chain(chain)
 
         query_params = {
@@ -1432,7 +2185,7 @@ class QuantNoteApi:
         }
         url = "assets"
         return self._handle_response(response_type="List[AvailableAsset]", endpoint=url, method="GET",
-                                     params=query_params)
+                                     params=query_params, cache="get_assets")
 
     def get_discord(self, from_: Union[str, int, dt], limit: int, tag: str = None, validate_params: bool = True) -> \
             List[models.DiscordPublicMessage]:
@@ -1451,7 +2204,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_ = self._validate_date(from_)
             self._validate_limit(limit)
 
@@ -1481,7 +2234,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_ = self._validate_date(from_)
             self._validate_limit(limit)
 
@@ -1511,7 +2264,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_ = self._validate_date(from_)
             self._validate_limit(limit)
 
@@ -1540,7 +2293,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_ = self._validate_date(from_)
             self._validate_limit(limit)
 
@@ -1570,7 +2323,7 @@ class QuantNoteApi:
             Whether the parameters are to be validated.
         """
 
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             from_ = self._validate_date(from_)
             self._validate_limit(limit)
 
@@ -1619,30 +2372,17 @@ class QuantNoteApi:
         data: pd.DataFrame
             Price data with volume.
         """
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract, from_, to = self._validate_symbol_contract_against_from__to_resolution_chain(symbol, contract,
                                                                                                    against, from_, to,
                                                                                                    resolution, chain)
 
-        prices = self.get_candles(symbol=symbol, contract=contract, from_=from_, to=to, chain=chain,
-                                  resolution=resolution, against=against, platform=platform, validate_params=False)
-        # if prices are empty, stop execution
-        if prices == []:
-            raise ValueError("Price data are empty. It does not make sence to continue.")
-
-        prices = pd.DataFrame(
-            [p.to_dict() for p in prices],
-        ).set_index("time")
-
-        volumes = self.get_volumes(symbol=symbol, contract=contract, from_=from_, to=to, chain=chain,
-                                   resolution=resolution, validate_params=False)
-        # if volumes are empty, stop execution
-        if volumes == []:
-            raise ValueError("Volume data are empty. It does not make sence to continue.")
-        volumes = pd.DataFrame(
-            [p.__dict__ for p in volumes],
-        ).set_index("time")
-        return prices.join(volumes)
+        response_types, queries = self._token_series_queries(("prices", "volumes"), contract=contract, from_=from_,
+                                                             to=to, chain=chain, resolution=resolution,
+                                                             against=against, platform=platform)
+        series = self._handle_candle_responses(response_type=response_types, queries=queries, method="GET",
+                                               required={name: self.SERIES_TITLES[name] for name in queries})
+        return self._map_result(series, self._OHLCVAS_frame)
 
     def get_OHLCVAS(self, contract: str = None, symbol: str = None, from_: Union[str, int, dt] = None,
                     to: Union[str, int, dt] = None, chain: Union[str, int] = "bsc", resolution: str = "H1",
@@ -1679,38 +2419,328 @@ class QuantNoteApi:
         data: pd.DataFrame
             Price data with volume.
         """
-        if validate_params:
+        if validate_params and not self.trust_inputs:
             contract, from_, to = self._validate_symbol_contract_against_from__to_resolution_chain(symbol, contract,
                                                                                                    against, from_, to,
                                                                                                    resolution, chain)
 
-        result = self.get_OHLCV(symbol=symbol, contract=contract, from_=from_, to=to, chain=chain,
-                                resolution=resolution, against=against, platform=platform, validate_params=False)
-        # if prices are empty, stop execution
-        if result.empty:
-            raise ValueError("OHLCV data are empty. It does not make sence to continue.")
-
-        addresses = self.get_active_addresses(symbol=symbol, contract=contract, from_=from_, to=to, chain=chain,
-                                              resolution=resolution, validate_params=False)
-        # if addresses are empty, stop execution
-        if addresses == []:
-            raise ValueError("Addresses data are empty. It does not make sence to continue.")
-        addresses = pd.DataFrame(
-            [p.__dict__ for p in addresses],
-        ).set_index("time").rename(columns={"count": "addresses_count"})
-        result = result.join(addresses)
+        response_types, queries = self._token_series_queries(("prices", "volumes", "addresses", "swaps"),
+                                                             contract=contract, from_=from_, to=to, chain=chain,
+                                                             resolution=resolution, against=against,
+                                                             platform=platform)
+        series = self._handle_candle_responses(response_type=response_types, queries=queries, method="GET",
+                                               required={name: self.SERIES_TITLES[name] for name in queries})
+        return self._map_result(series, self._OHLCVAS_frame)
 
-        swaps = self.get_swaps_number(symbol=symbol, contract=contract, from_=from_, to=to, chain=chain,
-                                      resolution=resolution, validate_params=False)
-        # if swaps are empty, stop execution
-        if swaps == []:
-            raise ValueError("Swaps data are empty. It does not make sence to continue.")
-        swaps = pd.DataFrame(
-            [p.__dict__ for p in swaps],
-        ).set_index("time").rename(columns={"count": "swaps_count"})
-        result = result.join(swaps).fillna(0)
+    def get_OHLCV_batch(self, symbols: List[str] = None, contracts: List[str] = None,
+                        from_: Union[str, int, dt] = None, to: Union[str, int, dt] = None,
+                        chain: Union[str, int] = "bsc", resolution: str = "H1", against: str = "USD",
+                        platform: str = None, validate_params: bool = True) -> Dict[str, pd.DataFrame]:
+        """
+        Get price data (in OHLC format) with volume for multiple tokens, all requests are sent concurrently.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        contracts : List[str]
+            Contract addresses of queried tokens.
+        symbols : List[str], default None
+            Symbols of the tokens, used if the contracts are not given.
+            Each has to be unique on the selected chain.
+        against : str
+            If price should be against PEG or USD.
+        from_ : int
+            Unix timestamp of start of wanted time interval, if omitted start of unix time is used.
+        to : int
+            Unix timestamp of end of wanted time interval, if omitted recent time is used.
+        resolution : str
+            Candle resolution.
+        platform : str
+            Comma separated platforms from which prices are taken, as a default value is taken the biggest platform on chain.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
 
-        return result
+        Returns
+        -------
+        data: Dict[str, pd.DataFrame]
+            Price data with volume by the given contract (or symbol, if the contracts are not given); tokens with
+            empty data are left out with a warning.
+        """
+        keys, contracts = self._validate_symbols_contracts_chain(symbols, contracts, chain, validate_params)
+        if validate_params and not self.trust_inputs:
+            self._validate_against(against)
+            from_, to = self._validate_from__to(from_=from_, to=to)
+            self._validate_resolution(resolution)
+
+        response_types, queries = {}, {}
+        for key, contract in zip(keys, contracts):
+            token_types, token_queries = self._token_series_queries(("prices", "volumes"), contract=contract,
+                                                                    from_=from_, to=to, chain=chain,
+                                                                    resolution=resolution, against=against,
+                                                                    platform=platform)
+            for name, query in token_queries.items():
+                response_types[key, name] = token_types[name]
+                queries[key, name] = query
+        series = self._handle_candle_responses(response_type=response_types, queries=queries, method="GET")
+        return self._map_result(series, functools.partial(self._OHLCV_frames, keys))
+
+    def _OHLCV_frames(self, keys: List[str], series: Dict[Tuple[str, str], list]) -> Dict[str, pd.DataFrame]:
+        """
+        Joins the price and volume series of each token, skipping the tokens with empty data.
+        """
+        frames = {}
+        for key in keys:
+            try:
+                frames[key] = self._OHLCVAS_frame({name: series[key, name] for name in ("prices", "volumes")})
+            except ValueError as err:
+                warnings.warn(f"{key}: {err}")
+        return frames
+
+    def _token_series_queries(self, names: Collection[str], contract: str, from_: int, to: int,
+                              chain: Union[str, int], resolution: str, against: str, platform: str) -> \
+            Tuple[Dict[str, str], Dict[str, Tuple[str, Dict[str, Union[int, str]]]]]:
+        """
+        Returns the response types and queries of the named time series of the token, so all of them are fetched
+        with one pool of requests.
+        """
+        response_types = {
+            "prices": "List[TokenPriceResponse]",
+            "volumes": "List[TradedVolumeResponse]",
+            "addresses": "List[ActiveAddressesResponse]",
+            "swaps": "List[ActiveAddressesResponse]",
+        }
+        paths = {
+            "volumes": "volumes",
+            "addresses": "active_addresses",
+            "swaps": "swaps/number",
+        }
+        queries = {}
+        for name in names:
+            if name == "prices":
+                queries[name] = self._candles_query(contract=contract, from_=from_, to=to, chain=chain,
+                                                    resolution=resolution, against=against, platform=platform)
+            else:
+                queries[name] = (f"chain/{chain}/tokens/{contract}/{paths[name]}",
+                                 {"from": from_, "to": to, "resolution": resolution})
+        return {name: response_types[name] for name in names}, queries
+
+    def _OHLCVAS_frame(self, series: Dict[str, list]) -> pd.DataFrame:
+        """
+        Joins the fetched time series of the token, the counts are available only if they were requested.
+        """
+        prices = self._time_series_frame(series["prices"], "Price")
+        frames = [self._time_series_frame(series["volumes"], "Volume")]
+        if "addresses" not in series:
+            return prices.join(frames)
+
+        frames.append(self._time_series_frame(series["addresses"], "Addresses", "addresses_count"))
+        frames.append(self._time_series_frame(series["swaps"], "Swaps", "swaps_count"))
+        # joined at once, with unique indexes pandas concatenates them and reindexes by the prices once
+        frame = prices.join(frames).fillna(0)
+        # the missing counts made the columns float64, they are restored as the narrowest fitting of int32/int64
+        counts = ["addresses_count", "swaps_count"]
+        dtype = "int32" if frame[counts].abs().max().max() <= self.INT32_MAX else "int64"
+        frame[counts] = frame[counts].astype(dtype)
+        return frame
+
+    @staticmethod
+    def _models_frame(data: List[models.AnyDefinition], index: str = "time") -> pd.DataFrame:
+        """
+        Builds the data frame column by column from the attributes of the models, instead of from a dict per row.
+        """
+        columns = list(vars(data[0]))
+        return pd.DataFrame({column: [p.__dict__.get(column) for p in data] for column in columns}).set_index(index)
+
+    @classmethod
+    def _time_series_frame(cls, data: list, name: str, count_column: str = None) -> pd.DataFrame:
+        """
+        Converts the time series into a data frame indexed by time, optionally renaming its count column.
+        """
+        cls._require_nonempty(data, name)
+        frame = cls._models_frame(data)
+        if count_column is not None:
+            frame = frame.rename(columns={"count": count_column})
+        return frame
+
+    def get_wallet_snapshot(self, address: str, limit: int = 10, chain: Union[str, int] = "bsc",
+                            validate_params: bool = True) -> Dict[str, object]:
+        """
+        Get the portfolio, farm portfolio, recent swaps and recent transactions of given wallet, the requests are sent
+        concurrently.
+
+        Parameters
+        ----------
+        address : str
+            Address of the wallet.
+        limit : int
+            Number of the most recent swaps and transactions; default value is 10.
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+
+        Returns
+        -------
+        data: Dict[str, object]
+            Results of ``get_wallets_portfolio``, ``get_wallets_farm_portfolio``, ``get_wallets_swaps`` and
+            ``get_wallets_txs`` by the keys "portfolio", "farm_portfolio", "swaps" and "txs".
+        """
+        if validate_params and not self.trust_inputs:
+            self._validate_chain(chain)
+            self._validate_limit(limit)
+
+        return self._gather_calls({
+            "portfolio": functools.partial(self.get_wallets_portfolio, address, chain=chain, validate_params=False),
+            "farm_portfolio": functools.partial(self.get_wallets_farm_portfolio, address, chain=chain,
+                                                validate_params=False),
+            "swaps": functools.partial(self.get_wallets_swaps, address, limit=limit, chain=chain,
+                                       validate_params=False),
+            "txs": functools.partial(self.get_wallets_txs, address, limit=limit, chain=chain, validate_params=False),
+        })
+
+    def get_token_snapshot(self, symbol: str = None, contract: str = None, chain: Union[str, int] = "bsc",
+                           against: str = None, validate_params: bool = True) -> Dict[str, object]:
+        """
+        Get the price, market capitalization, number of holders and pairs of given token, the requests are sent
+        concurrently.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        contract : str
+            Contract address of queried token.
+        symbol : str, default None
+            Symbol of the token.
+            If it is unique on the selected chain, the contract is entered.
+        against : str
+            If price should be against PEG or USD; default value is USD.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+
+        Returns
+        -------
+        data: Dict[str, object]
+            Results of ``get_price``, ``get_market_cap``, ``get_holders`` and ``get_pairs`` by the keys "price",
+            "market_cap", "holders" and "pairs".
+        """
+        if validate_params and not self.trust_inputs:
+            contract = self._validate_symbol_contract_chain(symbol, contract, chain)
+            self._validate_against(against)
+
+        return self._gather_calls({
+            "price": functools.partial(self.get_price, contract=contract, chain=chain, against=against,
+                                       validate_params=False),
+            "market_cap": functools.partial(self.get_market_cap, contract=contract, chain=chain, validate_params=False),
+            "holders": functools.partial(self.get_holders, contract=contract, chain=chain, validate_params=False),
+            "pairs": functools.partial(self.get_pairs, contract=contract, chain=chain, validate_params=False),
+        })
+
+    def iter_all_swaps(self, from_wallet: str = None, lp_token: str = None, sort: str = None, symbol: str = None,
+                       contract: str = None, from_: Union[str, int, dt] = None, to: Union[str, int, dt] = None,
+                       chain: Union[str, int] = "bsc", validate_params: bool = True) -> Iterator[models.LPMoveResponse]:
+        """
+        Iterates over all swaps of given token (see ``get_swaps``), the pages are fetched concurrently.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        contract : str
+            Contract address of queried token.
+        symbol : str, default None
+            Symbol of the token.
+            If it is unique on the selected chain, the contract is entered.
+        from_wallet : str
+            Address of wallet.
+        lp_token : str
+            Contract address of queried LP token.
+        from_ : int
+            Unix timestamp of start of wanted time interval, if omitted start of unix time is used.
+        to : int
+            Unix timestamp of end of wanted time interval, if omitted recent time is used.
+        sort : str
+            Sorting of result, supported formats of sort and ordering:"+column"/"-column" or "column.asc"/"column.desc" ; e.g.: "-created_at" for starting with most recent.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+        """
+        if validate_params and not self.trust_inputs:
+            from_, to = self._validate_from__to(from_, to)
+            contract = self._validate_symbol_contract_chain(symbol, contract, chain)
+            self._validate_sort(sort, columns=self.SWAPS_SORT_COLUMNS)
+
+        limit = self.LIMIT_LIMITS[1]
+        get_page = functools.partial(self.get_swaps, from_wallet=from_wallet, lp_token=lp_token, limit=limit,
+                                     sort=sort, contract=contract, from_=from_, to=to, chain=chain,
+                                     validate_params=False)
+        return self._iter_pages(get_page, limit)
+
+    def iter_all_wallets_swaps(self, address: str, token_contract: str = None, lp_token: str = None,
+                               sort: str = None, from_: Union[str, int, dt] = None, to: Union[str, int, dt] = None,
+                               chain: Union[str, int] = "bsc",
+                               validate_params: bool = True) -> Iterator[models.LPMoveResponse]:
+        """
+        Iterates over all swaps of given wallet (see ``get_wallets_swaps``), the pages are fetched concurrently.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        address : str
+            Address of wallet.
+        token_contract : str
+            Contract address of queried token.
+        lp_token : str
+            Contract address of queried LP token.
+        from_ : int
+            Unix timestamp of start of wanted time interval, if omitted start of unix time is used.
+        to : int
+            Unix timestamp of end of wanted time interval, if omitted recent time is used.
+        sort : str
+            Sorting of result, supported formats of sort and ordering:"+column"/"-column" or "column.asc"/"column.desc" ; e.g.: "-created_at" for starting with most recent.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+        """
+        if validate_params and not self.trust_inputs:
+            from_, to = self._validate_from__to(from_, to)
+            self._validate_sort(sort, columns=self.SWAPS_SORT_COLUMNS)
+            self._validate_chain(chain)
+
+        limit = self.LIMIT_LIMITS[1]
+        get_page = functools.partial(self.get_wallets_swaps, address, token_contract=token_contract,
+                                     lp_token=lp_token, limit=limit, sort=sort, from_=from_, to=to, chain=chain,
+                                     validate_params=False)
+        return self._iter_pages(get_page, limit)
+
+    def iter_all_wallets_txs(self, address: str, from_: Union[str, int, dt] = None, to: Union[str, int, dt] = None,
+                             chain: Union[str, int] = "bsc",
+                             validate_params: bool = True) -> Iterator[models.TransactionResponse]:
+        """
+        Iterates over all transactions of given wallet (see ``get_wallets_txs``), the pages are fetched concurrently.
+        Transactions repeated on a following page (e.g. when new ones shift the pages) are skipped.
+
+        Parameters
+        ----------
+        chain : str
+            Chain identifier - BSC/ETH/POLYGON; or by chain ID 56/1/137.
+        address : str
+            Address of wallet.
+        from_ : int
+            Unix timestamp of start of wanted time interval, if omitted start of unix time is used.
+        to : int
+            Unix timestamp of end of wanted time interval, if omitted recent time is used.
+        validate_params : bool, default True
+            Whether the parameters are to be validated.
+        """
+        if validate_params and not self.trust_inputs:
+            from_, to = self._validate_from__to(from_, to)
+            self._validate_chain(chain)
+
+        limit = self.LIMIT_LIMITS[1]
+        get_page = functools.partial(self.get_wallets_txs, address, limit=limit, from_=from_, to=to, chain=chain,
+                                     validate_params=False)
+        return self._iter_pages(get_page, limit, key=lambda tx: tx.tx_hash)
 
     ############################################     PLOTTING METHODS     ############################################
 
@@ -1809,12 +2839,8 @@ class QuantNoteApi:
         """
         volumes = self.get_volumes(symbol=symbol, contract=contract, from_=from_, to=to, chain=chain,
                                    resolution=resolution, validate_params=validate_params)
-        # if volumes are empty, stop execution
-        if volumes == []:
-            raise ValueError("Volume data are empty. It does not make sence to continue.")
-        volumes = pd.DataFrame(
-            [p.to_dict() for p in volumes],
-        ).set_index("time")
+        self._require_nonempty(volumes, "Volume")
+        volumes = self._models_frame(volumes)
 
         return self._plot_1d_data(
             data=volumes,
@@ -1878,12 +2904,8 @@ class QuantNoteApi:
         """
         swaps = self.get_swaps_number(symbol=symbol, contract=contract, from_=from_, to=to, chain=chain,
                                       resolution=resolution, validate_params=validate_params)
-        # if swaps are empty, stop execution
-        if swaps == []:
-            raise ValueError("Swaps data are empty. It does not make sence to continue.")
-        swaps = pd.DataFrame(
-            [p.to_dict() for p in swaps],
-        ).set_index("time")
+        self._require_nonempty(swaps, "Swaps")
+        swaps = self._models_frame(swaps)
 
         return self._plot_1d_data(
             data=swaps,
@@ -1949,12 +2971,8 @@ class QuantNoteApi:
         """
         addresses = self.get_active_addresses(contract=contract, symbol=symbol, from_=from_, to=to, chain=chain,
                                               resolution=resolution, validate_params=validate_params)
-        # if addresses are empty, stop execution
-        if addresses == []:
-            raise ValueError("Addresses data are empty. It does not make sence to continue.")
-        addresses = pd.DataFrame(
-            [p.to_dict() for p in addresses],
-        ).set_index("time")
+        self._require_nonempty(addresses, "Addresses")
+        addresses = self._models_frame(addresses)
 
         return self._plot_1d_data(
             data=addresses,
@@ -2024,12 +3042,8 @@ class QuantNoteApi:
             resolution=resolution,
             validate_params=validate_params,
         )
-        # if moves are empty, stop execution
-        if moves == []:
-            raise ValueError("Data of moves are empty. It does not make sence to continue.")
-        moves = pd.DataFrame(
-            [p.to_dict() for p in moves],
-        ).set_index("time")
+        self._require_nonempty(moves, "Moves")
+        moves = self._models_frame(moves)
 
         return self._plot_1d_data(
             data=moves["amount"],
@@ -2042,7 +3056,7 @@ class QuantNoteApi:
     def plot_candles(self, platform: str = None, contract: str = None, symbol: str = None,
                      from_: Union[str, int, dt] = None, to: Union[str, int, dt] = None, chain: Union[str, int] = "bsc",
                      resolution: str = "H1", against: str = "USD", validate_params: bool = True,
-                     kind: str = "line", backend: str = None, **kwargs):
+                     kind: str = "line", backend: str = None, ax=None, **kwargs):
         """
         Method for plotting the prices of the selected symbol for the required interval.
 
@@ -2084,6 +3098,8 @@ class QuantNoteApi:
         backend : str, default None
             Backend to use for plotting.
             Only "matplotlib" and "plotly" are available for this method.
+        ax : matplotlib.axes.Axes, default None
+            Axes to draw the candles on, so a figure can be reused; if omitted, a new figure is created.
         **kwargs
             Options to pass to matplotlib plotting method.
 
@@ -2096,35 +3112,45 @@ class QuantNoteApi:
         pricess = self.get_candles(symbol=symbol, contract=contract, from_=from_, to=to, chain=chain,
                                    resolution=resolution, against=against, platform=platform,
                                    validate_params=validate_params)
-        # if pricess are empty, stop execution
-        if pricess == []:
-            raise ValueError("Prices data are empty. It does not make sence to continue.")
-        df = pd.DataFrame(
-            [p.to_dict() for p in pricess],
-        ).set_index("time")
+        self._require_nonempty(pricess, "Prices")
+        # the candle charts take the columns directly, a data frame is built only for the other backends
+        times = [price.time for price in pricess]
+        opens, highs, lows, closes = ([getattr(price, column) for price in pricess]
+                                      for column in ("open", "high", "low", "close"))
 
         if backend == "matplotlib" or backend is None:
-            width = 1
-            width2 = 0.1
-            dfup = df[df["close"] >= df["open"]]
-            dfdown = df[df["close"] < df["open"]]
-
-            plt.figure(**kwargs)
-            plt.bar(dfup.index, dfup["close"] - dfup["open"], width, bottom=dfup["open"], color="g")
-            plt.bar(dfup.index, dfup["high"] - dfup["close"], width2, bottom=dfup["close"], color="g")
-            plt.bar(dfup.index, dfup["low"] - dfup["open"], width2, bottom=dfup["open"], color="g")
-
-            plt.bar(dfdown.index, dfdown["close"] - dfdown["open"], width, bottom=dfdown["open"], color="r")
-            plt.bar(dfdown.index, dfdown["high"] - dfdown["open"], width2, bottom=dfdown["open"], color="r")
-            plt.bar(dfdown.index, dfdown["low"] - dfdown["close"], width2, bottom=dfdown["close"], color="r")
-            plt.xticks(rotation=90)
-            plt.xlabel("date")
-            plt.ylabel("price")
-            plt.title(f"Prices of {symbol.upper() if symbol else contract} Token")
-            plt.grid()
-            return
+            import matplotlib.dates as mdates
+            import matplotlib.pyplot as plt
+            import numpy as np
+            from matplotlib.collections import LineCollection, PolyCollection
+
+            # all candles are drawn as two collections (wicks and bodies) instead of a bar artist per candle part
+            x = mdates.date2num(times)
+            opens, highs, lows, closes = (np.asarray(column, dtype=float) for column in (opens, highs, lows, closes))
+            width = 0.8 * (np.median(np.diff(x)) if len(x) > 1 else 1)
+            left, right = x - width / 2, x + width / 2
+            bodies = np.stack([np.stack(corner, axis=-1) for corner in
+                               ((left, opens), (left, closes), (right, closes), (right, opens))], axis=1)
+            wicks = np.stack([np.stack((x, lows), axis=-1), np.stack((x, highs), axis=-1)], axis=1)
+            colors = np.where(closes >= opens, "g", "r")
+
+            if ax is None:
+                ax = plt.figure(**kwargs).gca()
+            ax.add_collection(LineCollection(wicks, colors=colors))
+            ax.add_collection(PolyCollection(bodies, facecolors=colors, edgecolors=colors))
+            ax.xaxis_date()
+            ax.autoscale_view()
+            ax.tick_params(axis="x", labelrotation=90)
+            ax.set_xlabel("date")
+            ax.set_ylabel("price")
+            ax.set_title(f"Prices of {symbol.upper() if symbol else contract} Token")
+            ax.grid()
+            return ax
 
         if backend == "plotly":
+            import plotly.graph_objects as go
+            from plotly.subplots import make_subplots
+
             fig = make_subplots(
                 rows=1, cols=1, shared_xaxes=True,
                 vertical_spacing=0.07,
@@ -2133,9 +3159,9 @@ class QuantNoteApi:
                 **kwargs,
             )
 
-            fig.add_trace(go.Candlestick(x=df.index,
-                                         open=df["open"], high=df["high"],
-                                         low=df["low"], close=df["close"],
+            fig.add_trace(go.Candlestick(x=times,
+                                         open=opens, high=highs,
+                                         low=lows, close=closes,
                                          name="price"
                                          ),
                           )
@@ -2146,9 +3172,271 @@ class QuantNoteApi:
             return fig
 
         warnings.warn("Other backends are not (yet) supporter in this method. It might not work.")
-        return df.plot(
+        return self._models_frame(pricess).plot(
             title=f"Prices of {symbol.upper() if symbol else contract} Token",
             kind=kind,
             backend=backend,
+            ax=ax,
             **kwargs,
         )
+
+
+class AsyncQuantNoteApi(QuantNoteApi):
+    """
+    Rest API client library class with asynchronous methods.
+
+    All get methods (e.g. ``get_price``, ``get_candles``) return awaitables, so many of them can be gathered and sent
+    concurrently over one HTTP/2 connection pool; the requests needed to meet the candle limit are sent concurrently
+    as well. The assets translating the symbols are fetched on the event loop as well, before the first method given
+    a symbol validates its arguments. The plotting methods are available only on the blocking client.
+
+    Attributes
+    ----------
+    max_connections: int
+        Maximum number of concurrent connections.
+
+    max_workers: int
+        Maximum number of threads running the blocking helpers, passed to ``QuantNoteApi`` like the other keyword
+        arguments (e.g. ``cache_ttl``, ``cache_ttl_overrides``, ``trust_inputs``).
+    """
+
+    __slots__ = ("max_connections", "_async_session", "_assets_loading")
+
+    def __init__(self, auth_token: str, timeout_repetitions: int = 5, split_request: bool = True, timeout: float = 60,
+                 max_connections: int = 50, **kwargs):
+        # the other options (cache_ttl, cache_ttl_overrides, trust_inputs, ...) are passed to the blocking client
+        super().__init__(auth_token=auth_token, timeout_repetitions=timeout_repetitions, split_request=split_request,
+                         timeout=timeout, **kwargs)
+        self.max_connections = max_connections
+        self._assets_loading = None
+        self._async_session = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(http2=True, retries=timeout_repetitions,
+                                               limits=httpx.Limits(max_connections=max_connections)),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._async_session.aclose()
+        self.close()
+
+    def _handle_response(self, response_type: str, endpoint: str, method: str = "GET",
+                         params: Dict[str, Union[int, str]] = None, data=None, timeout_repetitions: int = None,
+                         timeout: float = None, cache: str = None):
+        return self._handle_response_async(response_type=response_type, endpoint=endpoint, method=method,
+                                           params=params, data=data, timeout_repetitions=timeout_repetitions,
+                                           timeout=timeout, cache=cache)
+
+    def _handle_responses(self, response_type: str, queries: Dict[Hashable, Tuple[str, Dict[str, Union[int, str]]]],
+                          method: str = "GET", cache: str = None):
+        return self._handle_responses_async(response_type=response_type, queries=queries, method=method, cache=cache)
+
+    def _handle_candle_response(self, response_type: str, endpoint: str, method: str = "GET",
+                                params: Dict[str, Union[int, str]] = None, data=None, timeout: float = None):
+        return self._handle_candle_response_async(response_type=response_type, endpoint=endpoint, method=method,
+                                                  params=params, data=data, timeout=timeout)
+
+    def _handle_candle_responses(self, response_type: Union[str, Dict[Hashable, str]],
+                                 queries: Dict[Hashable, Tuple[str, Dict[str, Union[int, str]]]],
+                                 method: str = "GET", data=None, timeout: float = None,
+                                 required: Dict[Hashable, str] = None):
+        return self._handle_candle_responses_async(response_type=response_type, queries=queries, method=method,
+                                                   data=data, timeout=timeout, required=required)
+
+    async def _map_result(self, result, function: Callable):
+        return function(await result)
+
+    async def _gather_calls(self, calls: Dict[Hashable, functools.partial]) -> Dict[Hashable, object]:
+        results = await asyncio.gather(*(call() for call in calls.values()))
+        return dict(zip(calls, results))
+
+    async def _iter_pages(self, get_page: functools.partial, limit: int,
+                          key: Callable[[models.AnyDefinition], Hashable] = None):
+        seen = set()
+        page = self.PAGE_LIMITS[0]
+        window = 1
+        tasks = []
+        try:
+            while True:
+                tasks = [asyncio.ensure_future(get_page(page=page + offset)) for offset in range(window)]
+                for task in tasks:
+                    items = await task or []
+                    for item in items:
+                        if key is not None:
+                            item_key = key(item)
+                            if item_key in seen:
+                                continue
+                            seen.add(item_key)
+                        yield item
+                    if len(items) < limit:
+                        return
+                page += window
+                window = self.max_workers
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fill_assets_async(self) -> None:
+        """
+        Fetches the assets for the symbol lookups without blocking the event loop; the concurrent first lookups share
+        one request.
+        """
+        if self._assets_loading is None:
+            url = "assets"
+            self._assets_loading = asyncio.ensure_future(
+                self._request_async(f"{self.api_server}/{url}", method="GET", params=self._query_params()))
+        try:
+            data = await asyncio.shield(self._assets_loading)
+        except BaseException:
+            self._assets_loading = None
+            raise
+        if self._symbol_index is None:
+            self._index_assets(data)
+
+    async def _handle_response_async(self, response_type: str, endpoint: str, method: str = "GET",
+                                     params: Dict[str, Union[int, str]] = None, data=None,
+                                     timeout_repetitions: int = None, timeout: float = None,
+                                     cache: str = None) -> Type[models.AnyDefinition]:
+        params = self._query_params(params)
+        cache_key, ttl = self._cache_key(cache, method, endpoint, params)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return self._unmarshal_data(response_type, cached[1])
+
+        data = await self._request_async(f"{self.api_server}/{endpoint}", method=method, params=params, data=data,
+                                         timeout_repetitions=timeout_repetitions, timeout=timeout)
+        if cache_key is not None:
+            self._cache_store(cache_key, ttl, data)
+        return self._unmarshal_data(response_type, data)
+
+    async def _handle_responses_async(self, response_type: str,
+                                      queries: Dict[Hashable, Tuple[str, Dict[str, Union[int, str]]]],
+                                      method: str = "GET",
+                                      cache: str = None) -> Dict[Hashable, Type[models.AnyDefinition]]:
+        responses = await asyncio.gather(*(
+            self._handle_response_async(response_type, endpoint, method=method, params=params, cache=cache)
+            for endpoint, params in queries.values()
+        ))
+        return dict(zip(queries, responses))
+
+    async def _handle_candle_response_async(self, response_type: str, endpoint: str, method: str = "GET",
+                                            params: Dict[str, Union[int, str]] = None, data=None,
+                                            timeout: float = None):
+        results = await self._handle_candle_responses_async(response_type=response_type,
+                                                            queries={endpoint: (endpoint, params)}, method=method,
+                                                            data=data, timeout=timeout)
+        return results[endpoint]
+
+    async def _handle_candle_responses_async(self, response_type: Union[str, Dict[Hashable, str]],
+                                             queries: Dict[Hashable, Tuple[str, Dict[str, Union[int, str]]]],
+                                             method: str = "GET", data=None, timeout: float = None,
+                                             required: Dict[Hashable, str] = None) -> Dict[Hashable, list]:
+        response_types = self._response_types(response_type, queries)
+        requests = self._candle_requests(queries)
+        remaining = Counter(key for key, *_ in requests)
+        slices = [None] * len(requests)
+
+        async def indexed_slice(index: int, key: Hashable, absolute_url: str, params: Dict[str, Union[int, str]],
+                                live: bool):
+            return index, await self._candle_slice_async(response_types[key], absolute_url, method=method,
+                                                         params=params, data=data, timeout=timeout, live=live)
+
+        tasks = [asyncio.ensure_future(indexed_slice(index, *request)) for index, request in enumerate(requests)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                index, items = await task
+                self._collect_slice(requests, slices, remaining, index, required, items)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return self._joined_slices(queries, requests, slices)
+
+    async def _candle_slice_async(self, response_type: str, absolute_url: str, method: str = "GET",
+                                  params: Dict[str, Union[int, str]] = None, data=None, timeout: float = None,
+                                  live: bool = False) -> list:
+        cache_key, ttl = self._slice_cache_key(method, absolute_url, params, live)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return self._unmarshal_data(response_type, cached[1]) or []
+
+        response_data = await self._request_async(absolute_url, method=method, params=params, data=data,
+                                                  timeout=timeout)
+        if cache_key is not None:
+            self._cache_store(cache_key, ttl, response_data)
+        return self._unmarshal_data(response_type, response_data) or []
+
+    async def _request_async(self, absolute_url: str, method: str = "GET", params: Dict[str, Union[int, str]] = None,
+                             data=None, timeout_repetitions: int = None, timeout: float = None):
+        if timeout_repetitions is None:
+            timeout_repetitions = self.timeout_repetitions
+
+        url = self._request_url(absolute_url, params)
+        content = self._request_content(data)
+        try:
+            for repetition in range(timeout_repetitions + 1):
+                response = await self._async_session.request(method=method, url=url, content=content,
+                                                             timeout=timeout if timeout else self.timeout)
+                if response.status_code not in self.RETRY_STATUSES or repetition == timeout_repetitions:
+                    break
+                await asyncio.sleep(self._retry_delay(response, repetition))
+            data = orjson.loads(response.content)
+            response.raise_for_status()
+        except (httpx.HTTPError, ValueError) as err:
+            self._raise_api_error(data, err)
+        return data
+
+    def _plot_unsupported(self, *args, **kwargs):
+        raise NotImplementedError("Plotting methods are available only on the blocking QuantNoteApi client.")
+
+    plot_volumes = plot_swaps_number = plot_active_addresses = plot_wallets_moves = plot_candles = _plot_unsupported
+
+
+def _resolving_symbols(method: Callable) -> Callable:
+    """
+    Wraps the public method of the asynchronous client, so the assets translating its symbols are fetched on the event
+    loop before the (blocking) validation of the arguments runs.
+    """
+    signature = inspect.signature(method)
+
+    def needs_assets(client: AsyncQuantNoteApi, args: tuple, kwargs: dict) -> bool:
+        arguments = signature.bind_partial(client, *args, **kwargs).arguments
+        return client._symbol_index is None and (
+            arguments.get("symbol") is not None and arguments.get("contract") is None
+            or arguments.get("symbols") is not None and arguments.get("contracts") is None)
+
+    if method.__name__.startswith("iter_all_"):
+        @functools.wraps(method)
+        async def iter_resolved(self, *args, **kwargs):
+            if needs_assets(self, args, kwargs):
+                await self._fill_assets_async()
+            items = method(self, *args, **kwargs)
+            try:
+                async for item in items:
+                    yield item
+            finally:
+                await items.aclose()
+
+        return iter_resolved
+
+    @functools.wraps(method)
+    async def resolved(self, *args, **kwargs):
+        if needs_assets(self, args, kwargs):
+            await self._fill_assets_async()
+        return await method(self, *args, **kwargs)
+
+    return resolved
+
+
+# get_assets filters the assets by the symbol itself, it does not translate it
+for _name, _method in list(vars(QuantNoteApi).items()):
+    if _name.startswith(("get_", "iter_all_")) and _name != "get_assets" and _name not in vars(AsyncQuantNoteApi) \
+            and {"symbol", "symbols"} & set(inspect.signature(_method).parameters):
+        setattr(AsyncQuantNoteApi, _name, _resolving_symbols(_method))
+del _name, _method
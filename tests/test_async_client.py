@@ -0,0 +1,163 @@
+import asyncio
+import unittest
+
+import httpx
+
+from quantnote_api.quantnote_api import AsyncQuantNoteApi
+
+CANDLES = [{"time": "2022-01-01T00:00:00Z", "open": 1, "high": 2, "low": 0.5, "close": 1.5}]
+
+
+def _client(**kwargs) -> AsyncQuantNoteApi:
+    client = AsyncQuantNoteApi("tok", **kwargs)
+
+    async def handler(request):
+        return httpx.Response(200, json=CANDLES)
+
+    client._async_session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TrustedAsyncClientTest(unittest.TestCase):
+    def test_trusted_mode_skips_validation(self):
+        async def run():
+            async with _client(trust_inputs=True) as client:
+                self.assertTrue(client.trust_inputs)
+                # the contract would not pass the validation
+                return await client.get_candles(contract="bad", from_=1640995200, to=1641081600, resolution="D1")
+
+        candles = asyncio.run(run())
+        self.assertEqual(candles[0].close, 1.5)
+
+    def test_trusted_context(self):
+        async def run():
+            async with _client() as client:
+                with self.assertRaises(Exception):
+                    await client.get_candles(contract="bad", from_=1640995200, to=1641081600, resolution="D1")
+                with client.trusted():
+                    self.assertTrue(client.trust_inputs)
+                    candles = await client.get_candles(contract="bad", from_=1640995200, to=1641081600,
+                                                       resolution="D1")
+                self.assertFalse(client.trust_inputs)
+                return candles
+
+        candles = asyncio.run(run())
+        self.assertEqual(len(candles), 1)
+
+    def test_trusted_context_is_per_task(self):
+        async def run():
+            async with _client() as client:
+                entered = asyncio.Event()
+                release = asyncio.Event()
+
+                async def trusted_task():
+                    with client.trusted():
+                        entered.set()
+                        await release.wait()
+                        return client.trust_inputs
+
+                task = asyncio.ensure_future(trusted_task())
+                await entered.wait()
+                # the other tasks still validate while the block of the trusted one is open
+                with self.assertRaises(Exception):
+                    await client.get_candles(contract="bad", from_=1640995200, to=1641081600, resolution="D1")
+                untrusted = client.trust_inputs
+                release.set()
+                return untrusted, await task
+
+        self.assertEqual(asyncio.run(run()), (False, True))
+
+
+class AsyncClientOptionsTest(unittest.TestCase):
+    def test_cache_options(self):
+        async def run():
+            async with _client(cache_ttl=0) as disabled, _client(cache_ttl_overrides={"get_pairs": 5}) as client:
+                return disabled.cache_ttls, client.cache_ttls
+
+        disabled, ttls = asyncio.run(run())
+        self.assertEqual(disabled, {})
+        self.assertEqual(ttls["get_pairs"], 5)
+
+    def test_max_workers(self):
+        async def run():
+            async with _client(max_workers=4) as client:
+                return client.max_workers, client._get_executor()._max_workers
+
+        self.assertEqual(asyncio.run(run()), (4, 4))
+
+
+class AsyncSymbolLookupTest(unittest.TestCase):
+    def test_assets_fetched_without_blocking(self):
+        contract = "0x" + "a" * 40
+        paths = []
+
+        async def handler(request):
+            paths.append(request.url.path)
+            if request.url.path.endswith("/assets"):
+                return httpx.Response(200, json=[{"symbol": "AAA", "chain": "BSC", "contract": contract}])
+            return httpx.Response(200, json=CANDLES)
+
+        def blocking(request):
+            raise AssertionError("the blocking session was used")
+
+        async def run():
+            client = AsyncQuantNoteApi("tok")
+            client._session = httpx.Client(transport=httpx.MockTransport(blocking))
+            client._async_session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                return await asyncio.gather(*(
+                    client.get_candles(symbol="AAA", chain="bsc", from_=1640995200, to=1641081600, resolution="D1")
+                    for _ in range(3)
+                ))
+
+        results = asyncio.run(run())
+        self.assertEqual([len(candles) for candles in results], [1, 1, 1])
+        # the concurrent first lookups share one request of the assets
+        self.assertEqual(sum(path.endswith("/assets") for path in paths), 1)
+        self.assertTrue(all(contract in path for path in paths if not path.endswith("/assets")))
+
+
+class AsyncPagesTest(unittest.TestCase):
+    def _pages(self, client: AsyncQuantNoteApi, last: int):
+        cancelled = []
+
+        async def get_page(page):
+            try:
+                # the first two pages arrive before the following ones
+                await asyncio.sleep(0 if page <= client.PAGE_LIMITS[0] + 1 else 0.05)
+                return [page, page] if page < last else [page]
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+
+        return client._iter_pages(get_page, limit=2), cancelled
+
+    def test_pending_pages_cancelled_after_last_page(self):
+        async def run():
+            async with _client(max_workers=4) as client:
+                pages, cancelled = self._pages(client, last=client.PAGE_LIMITS[0] + 1)
+                items = [item async for item in pages]
+                await asyncio.sleep(0)
+                return client.PAGE_LIMITS[0], items, cancelled
+
+        first, items, cancelled = asyncio.run(run())
+        self.assertEqual(items, [first, first, first + 1])
+        self.assertEqual(sorted(cancelled), [first + 2, first + 3, first + 4])
+
+    def test_pending_pages_cancelled_when_closed(self):
+        async def run():
+            async with _client(max_workers=4) as client:
+                pages, cancelled = self._pages(client, last=client.PAGE_LIMITS[0] + 10)
+                async for item in pages:
+                    if item > client.PAGE_LIMITS[0]:
+                        break
+                await pages.aclose()
+                await asyncio.sleep(0)
+                return client.PAGE_LIMITS[0], cancelled
+
+        first, cancelled = asyncio.run(run())
+        self.assertEqual(sorted(cancelled), [first + 2, first + 3, first + 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
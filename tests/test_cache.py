@@ -0,0 +1,28 @@
+import unittest
+from unittest import mock
+
+from quantnote_api.quantnote_api import QuantNoteApi
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.client = QuantNoteApi("tok")
+        self.addCleanup(self.client.close)
+
+    def test_expired_entries_swept_on_store(self):
+        with mock.patch("quantnote_api.quantnote_api.time.monotonic", return_value=100.0):
+            self.client._cache_store("short", 1, "a")
+            self.client._cache_store("long", 60, "b")
+        with mock.patch("quantnote_api.quantnote_api.time.monotonic", return_value=102.0):
+            self.client._cache_store("new", 1, "c")
+        self.assertEqual(list(self.client._cache), ["long", "new"])
+
+    def test_size_bounded(self):
+        with mock.patch.object(QuantNoteApi, "CACHE_MAX_SIZE", 2):
+            for key in "abc":
+                self.client._cache_store(key, 60, key)
+        self.assertEqual(list(self.client._cache), ["b", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()